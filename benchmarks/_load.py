@@ -0,0 +1,22 @@
+"""
+Load single Ignis modules that only depend on the standard library,
+without importing the ``ignis`` package (and PyGObject).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+from types import ModuleType
+
+_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ignis")
+
+
+def load_module(name: str, relative_path: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(_ROOT, relative_path)
+    )
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,207 @@
+"""
+Benchmark HyprlandService and NiriService against fake compositors.
+
+Measures events processed per second, property notifications emitted
+and main loop latency while a synthetic (or recorded) event flood is replayed.
+
+Requires Ignis and its runtime dependencies and a D-Bus session bus
+(e.g. run under ``dbus-run-session``)::
+
+    python benchmarks/compositor_ipc.py hyprland --events 20000
+    python benchmarks/compositor_ipc.py niri --trace niri-trace.jsonl
+
+Record a trace from a live compositor::
+
+    python benchmarks/compositor_ipc.py niri --record niri-trace.jsonl --duration 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_compositor  # noqa: E402
+
+_DONE = "__bench_done__"
+_LATENCY_INTERVAL_MS = 5
+
+
+def _setup_env(compositor: str, tmp: str) -> str:
+    # Must happen before ignis.services.* are imported, socket paths are read from env at import time
+    if compositor == "hyprland":
+        os.environ["XDG_RUNTIME_DIR"] = tmp
+        os.environ["HYPRLAND_INSTANCE_SIGNATURE"] = "bench"
+        return f"{tmp}/hypr/bench"
+    else:
+        path = f"{tmp}/niri.sock"
+        os.environ["NIRI_SOCKET"] = path
+        return path
+
+
+def _record(compositor: str, out: str, duration: float) -> None:
+    if compositor == "hyprland":
+        path = f"{os.environ['XDG_RUNTIME_DIR']}/hypr/{os.environ['HYPRLAND_INSTANCE_SIGNATURE']}/.socket2.sock"
+    else:
+        path = os.environ["NIRI_SOCKET"]
+
+    count = fake_compositor.record_trace(path, out, duration, niri=compositor == "niri")
+    print(f"Recorded {count} events to {out}")
+
+
+def run(compositor: str, n_events: int, trace_path: str | None, flood: bool) -> None:
+    tmp = tempfile.mkdtemp(prefix="ignis-bench-")
+    path = _setup_env(compositor, tmp)
+
+    if compositor == "hyprland":
+        state = fake_compositor.hyprland_state()
+        server: fake_compositor._FakeServer = fake_compositor.FakeHyprland(path, state)
+        trace = (
+            fake_compositor.load_trace(trace_path)
+            if trace_path
+            else fake_compositor.hyprland_flood(state, n_events)
+        )
+        trace.append({"event": f"activelayout>>keyboard,{_DONE}"})
+    else:
+        state = fake_compositor.niri_state()
+        server = fake_compositor.FakeNiri(path, state)
+        trace = (
+            fake_compositor.load_trace(trace_path)
+            if trace_path
+            else fake_compositor.niri_flood(state, n_events)
+        )
+        trace.append(
+            {
+                "event": {
+                    "KeyboardLayoutsChanged": {
+                        "keyboard_layouts": {"names": [_DONE], "current_idx": 0}
+                    }
+                }
+            }
+        )
+
+    import ignis  # noqa: F401
+    from gi.repository import GLib  # type: ignore
+    from ignis.app import IgnisApp
+
+    IgnisApp()
+
+    start_init = time.perf_counter()
+    if compositor == "hyprland":
+        from ignis.services.hyprland import HyprlandService
+
+        service = HyprlandService.get_default()
+
+        def is_done() -> bool:
+            return service.main_keyboard.active_keymap == _DONE
+    else:
+        from ignis.services.niri import NiriService
+
+        service = NiriService.get_default()
+
+        def is_done() -> bool:
+            return service.keyboard_layouts.names == [_DONE]
+
+    init_time = time.perf_counter() - start_init
+    server.wait_for_subscribers()
+
+    notifications = 0
+
+    def on_notify(*_) -> None:
+        nonlocal notifications
+        notifications += 1
+
+    service.connect("notify", on_notify)
+
+    latencies: list[float] = []
+    last_tick = time.perf_counter()
+
+    def on_tick() -> bool:
+        nonlocal last_tick
+        now = time.perf_counter()
+        latencies.append((now - last_tick) * 1000 - _LATENCY_INTERVAL_MS)
+        last_tick = now
+        return True
+
+    loop = GLib.MainLoop()
+    result: dict[str, float] = {}
+
+    def check_done() -> bool:
+        if is_done():
+            result["elapsed"] = time.perf_counter() - result["start"]
+            # let queued idle notifications drain
+            GLib.timeout_add(100, loop.quit)
+            return False
+        return True
+
+    def replay() -> None:
+        result["sent"] = server.replay(trace, flood=flood)
+
+    # replay from another thread, so the service's main loop dispatches events as they arrive
+    replay_thread = threading.Thread(target=replay, daemon=True)
+
+    def start() -> bool:
+        nonlocal last_tick
+        last_tick = time.perf_counter()
+        GLib.timeout_add(_LATENCY_INTERVAL_MS, on_tick)
+        result["start"] = time.perf_counter()
+        replay_thread.start()
+        GLib.timeout_add(1, check_done)
+        return False
+
+    GLib.idle_add(start)
+    loop.run()
+    replay_thread.join()
+    server.stop()
+
+    elapsed = result["elapsed"]
+    sent = result["sent"]
+    latencies.sort()
+    print(f"compositor:         {compositor}")
+    print(f"service init:       {init_time * 1000:.1f} ms")
+    print(f"requests served:    {len(server.requests)}")
+    print(f"events sent:        {sent:.0f}")
+    print(f"elapsed:            {elapsed * 1000:.1f} ms")
+    print(f"events/s:           {sent / elapsed:.0f}")
+    print(f"notifications:      {notifications}")
+    if latencies:
+        print(
+            "main loop latency:  "
+            f"p50 {statistics.median(latencies):.2f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.2f} ms, "
+            f"max {latencies[-1]:.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("compositor", choices=["hyprland", "niri"])
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument(
+        "--trace", help="replay a recorded trace instead of a synthetic flood"
+    )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="respect the delays recorded in the trace",
+    )
+    parser.add_argument(
+        "--record", metavar="FILE", help="record a trace from a live compositor"
+    )
+    parser.add_argument("--duration", type=float, default=30)
+    args = parser.parse_args()
+
+    if args.record:
+        _record(args.compositor, args.record, args.duration)
+    else:
+        run(args.compositor, args.events, args.trace, flood=not args.realtime)
+
+
+if __name__ == "__main__":
+    main()
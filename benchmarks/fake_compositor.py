@@ -0,0 +1,433 @@
+"""
+Fake Hyprland and Niri IPC servers that replay recorded event traces.
+
+Only the standard library is used, so this module can be imported
+without Ignis or PyGObject installed.
+
+A trace is a JSON Lines file, one step per line:
+
+.. code-block:: json
+
+    {"event": "openwindow>>5613a1c0,1,kitty,kitty", "set": {"clients": [...]}, "delay": 0.01}
+
+- ``event``: the raw Hyprland event line, or the Niri event object.
+- ``set``: optional, replaces top-level keys of the scripted state *before* the event is sent.
+- ``delay``: optional, seconds to wait before the step (ignored when flooding).
+
+Use :func:`record_trace` to capture a trace from a live compositor.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+Step = dict[str, Any]
+
+
+def load_trace(path: str) -> list[Step]:
+    with open(path) as fp:
+        return [json.loads(line) for line in fp if line.strip()]
+
+
+def save_trace(path: str, trace: Iterable[Step]) -> None:
+    with open(path, "w") as fp:
+        for step in trace:
+            fp.write(json.dumps(step) + "\n")
+
+
+def record_trace(socket_path: str, out_path: str, duration: float, niri: bool) -> int:
+    """
+    Record events from a live compositor event socket into a trace file.
+    Returns the number of recorded events.
+    """
+    count = 0
+    deadline = time.monotonic() + duration
+    last = time.monotonic()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        if niri:
+            sock.sendall(b'"EventStream"\n')
+        sock.settimeout(0.2)
+        buffer = b""
+
+        with open(out_path, "w") as fp:
+            while time.monotonic() < deadline:
+                try:
+                    chunk = sock.recv(65536)
+                except TimeoutError:
+                    continue
+                if not chunk:
+                    break
+
+                now = time.monotonic()
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    raw = line.decode()
+                    event: Any = json.loads(raw) if niri else raw
+                    if niri and "Ok" in event:
+                        # reply to the EventStream request itself
+                        continue
+
+                    fp.write(json.dumps({"event": event, "delay": now - last}) + "\n")
+                    last = now
+                    count += 1
+
+    return count
+
+
+class _FakeServer:
+    def __init__(self, state: dict[str, Any]) -> None:
+        self.state = state
+        self.requests: list[str] = []
+        self._subscribers: list[socket.socket] = []
+        self._lock = threading.Lock()
+        self._listeners: list[socket.socket] = []
+        self._stopped = False
+
+    def _listen(self, path: str, handler) -> None:
+        if os.path.exists(path):
+            os.unlink(path)
+        srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        srv.bind(path)
+        srv.listen(64)
+        self._listeners.append(srv)
+
+        def accept_loop() -> None:
+            while not self._stopped:
+                try:
+                    conn, _ = srv.accept()
+                except OSError:
+                    return
+                threading.Thread(target=handler, args=(conn,), daemon=True).start()
+
+        threading.Thread(target=accept_loop, daemon=True).start()
+
+    def _subscribe(self, conn: socket.socket) -> None:
+        with self._lock:
+            self._subscribers.append(conn)
+
+    def _format_event(self, event: Any) -> bytes:
+        raise NotImplementedError()
+
+    def broadcast(self, events: Iterable[Any]) -> int:
+        """
+        Send events to all subscribed event sockets as one write per subscriber.
+        Returns the number of events sent.
+        """
+        payload = b"".join(self._format_event(event) for event in events)
+        with self._lock:
+            for conn in self._subscribers:
+                conn.sendall(payload)
+        return payload.count(b"\n")
+
+    def replay(self, trace: Iterable[Step], flood: bool = False) -> int:
+        """
+        Replay a trace. If ``flood`` is ``True``, delays are ignored
+        and consecutive events are batched into as few writes as possible.
+        Returns the number of events sent.
+        """
+        sent = 0
+        pending: list[Any] = []
+        for step in trace:
+            if "set" in step:
+                sent += self.broadcast(pending)
+                pending = []
+                self.state.update(step["set"])
+
+            if not flood and step.get("delay"):
+                sent += self.broadcast(pending)
+                pending = []
+                time.sleep(step["delay"])
+
+            pending.append(step["event"])
+
+        sent += self.broadcast(pending)
+        return sent
+
+    def wait_for_subscribers(self, count: int = 1, timeout: float = 5) -> None:
+        deadline = time.monotonic() + timeout
+        while len(self._subscribers) < count:
+            if time.monotonic() > deadline:
+                raise TimeoutError("no client subscribed to the event socket")
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self._stopped = True
+        for srv in self._listeners:
+            srv.close()
+        with self._lock:
+            for conn in self._subscribers:
+                conn.close()
+            self._subscribers.clear()
+
+
+class FakeHyprland(_FakeServer):
+    """
+    Serves ``.socket.sock`` (requests) and ``.socket2.sock`` (events) in ``socket_dir``.
+
+    ``j/NAME`` requests are answered with ``state[NAME]`` serialized to JSON,
+    every other request is answered with ``ok``.
+    """
+
+    def __init__(self, socket_dir: str, state: dict[str, Any]) -> None:
+        super().__init__(state)
+        os.makedirs(socket_dir, exist_ok=True)
+        self._listen(f"{socket_dir}/.socket.sock", self.__handle_request)
+        self._listen(f"{socket_dir}/.socket2.sock", self._subscribe)
+
+    def __handle_request(self, conn: socket.socket) -> None:
+        with conn:
+            cmd = conn.recv(8192).decode()
+            self.requests.append(cmd)
+
+            if cmd.startswith("j/"):
+                reply = json.dumps(self.state.get(cmd[2:], {}))
+            else:
+                reply = "ok"
+
+            conn.sendall(reply.encode())
+
+    def _format_event(self, event: Any) -> bytes:
+        return f"{event}\n".encode()
+
+
+class FakeNiri(_FakeServer):
+    """
+    Serves the Niri IPC socket at ``path``.
+
+    A connection requesting ``"EventStream"`` first receives the initial state events
+    built from ``state`` and then the replayed events.
+    A request ``"NAME"`` is answered with ``{"Ok": {"NAME": state[NAME]}}``,
+    actions are answered with ``{"Ok": "Handled"}``.
+    """
+
+    def __init__(self, path: str, state: dict[str, Any]) -> None:
+        super().__init__(state)
+        self._listen(path, self.__handle_connection)
+
+    def __handle_connection(self, conn: socket.socket) -> None:
+        reader = conn.makefile("rb")
+        for line in reader:
+            request = json.loads(line)
+            self.requests.append(line.decode().rstrip("\n"))
+
+            if request == "EventStream":
+                conn.sendall(b'{"Ok":"Handled"}\n')
+                conn.sendall(
+                    b"".join(self._format_event(e) for e in self.initial_events())
+                )
+                self._subscribe(conn)
+                return
+
+            if isinstance(request, str) and request in self.state:
+                reply = {"Ok": {request: self.state[request]}}
+            else:
+                reply = {"Ok": "Handled"}
+
+            conn.sendall(json.dumps(reply).encode() + b"\n")
+
+        reader.close()
+        conn.close()
+
+    def initial_events(self) -> list[dict[str, Any]]:
+        # OverviewOpenedOrClosed must be the last one, see NiriService.__start_event_stream()
+        return [
+            {"WorkspacesChanged": {"workspaces": self.state["Workspaces"]}},
+            {
+                "KeyboardLayoutsChanged": {
+                    "keyboard_layouts": self.state["KeyboardLayouts"]
+                }
+            },
+            {"WindowsChanged": {"windows": self.state["Windows"]}},
+            {"OverviewOpenedOrClosed": {"is_open": False}},
+        ]
+
+    def _format_event(self, event: Any) -> bytes:
+        return json.dumps(event).encode() + b"\n"
+
+
+def hyprland_state(n_windows: int = 20, n_workspaces: int = 10) -> dict[str, Any]:
+    workspaces = [
+        {
+            "id": i,
+            "name": str(i),
+            "monitor": "eDP-1",
+            "monitorID": 0,
+            "windows": 0,
+            "hasfullscreen": False,
+            "lastwindow": "0x0",
+            "lastwindowtitle": "",
+        }
+        for i in range(1, n_workspaces + 1)
+    ]
+    clients = [
+        {
+            "address": f"0x{i:x}",
+            "mapped": True,
+            "hidden": False,
+            "at": [0, 0],
+            "size": [800, 600],
+            "workspace": {
+                "id": i % n_workspaces + 1,
+                "name": str(i % n_workspaces + 1),
+            },
+            "floating": False,
+            "pseudo": False,
+            "monitor": 0,
+            "class": "kitty",
+            "title": f"Window {i}",
+            "initialClass": "kitty",
+            "initialTitle": "kitty",
+            "pid": 1000 + i,
+            "xwayland": False,
+            "pinned": False,
+            "fullscreen": 0,
+            "fullscreenClient": 0,
+            "grouped": [],
+            "tags": [],
+            "swallowing": "0x0",
+            "focusHistoryID": i,
+        }
+        for i in range(1, n_windows + 1)
+    ]
+    return {
+        "workspaces": workspaces,
+        "activeworkspace": workspaces[0],
+        "clients": clients,
+        "activewindow": clients[0] if clients else {},
+        "monitors": [
+            {
+                "id": 0,
+                "name": "eDP-1",
+                "description": "",
+                "make": "",
+                "model": "",
+                "serial": "",
+                "width": 1920,
+                "height": 1080,
+                "refreshRate": 60.0,
+                "x": 0,
+                "y": 0,
+                "activeWorkspace": {"id": 1, "name": "1"},
+                "specialWorkspace": {"id": 0, "name": ""},
+                "reserved": [0, 0, 0, 0],
+                "scale": 1.0,
+                "transform": 0,
+                "focused": True,
+                "dpmsStatus": True,
+                "vrr": False,
+                "activelyTearing": False,
+                "disabled": False,
+                "currentFormat": "",
+                "availableModes": [],
+            }
+        ],
+        "devices": {
+            "keyboards": [
+                {
+                    "address": "0x1",
+                    "name": "keyboard",
+                    "rules": "",
+                    "model": "",
+                    "layout": "us",
+                    "variant": "",
+                    "options": "",
+                    "active_keymap": "English (US)",
+                    "main": True,
+                }
+            ]
+        },
+    }
+
+
+def hyprland_flood(state: dict[str, Any], n_events: int) -> list[Step]:
+    """
+    A synthetic flood of Hyprland events: title changes, focus changes and workspace switches.
+    """
+    clients = state["clients"]
+    workspaces = state["workspaces"]
+    trace: list[Step] = []
+    for i in range(n_events):
+        client = clients[i % len(clients)]
+        addr = client["address"][2:]
+        match i % 10:
+            case 0:
+                # cycle through workspaces, starting from one that isn't active
+                ws = workspaces[(i // 10 + 1) % len(workspaces)]
+                trace.append({"event": f"workspace>>{ws['name']}"})
+            case 1 | 2:
+                trace.append({"event": f"activewindow>>kitty,Window {i}"})
+            case _:
+                trace.append({"event": f"windowtitlev2>>{addr},Title {i}, with comma"})
+    return trace
+
+
+def niri_state(n_windows: int = 20, n_workspaces: int = 10) -> dict[str, Any]:
+    workspaces = [
+        {
+            "id": i,
+            "idx": i,
+            "name": None,
+            "output": "eDP-1",
+            "is_urgent": False,
+            "is_active": i == 1,
+            "is_focused": i == 1,
+            "active_window_id": None,
+        }
+        for i in range(1, n_workspaces + 1)
+    ]
+    windows = [
+        {
+            "id": i,
+            "title": f"Window {i}",
+            "app_id": "kitty",
+            "pid": 1000 + i,
+            "workspace_id": i % n_workspaces + 1,
+            "is_focused": i == 1,
+            "is_floating": False,
+            "is_urgent": False,
+            "layout": {
+                "pos_in_scrolling_layout": [i, 1],
+                "tile_size": [800.0, 600.0],
+                "window_size": [800, 600],
+                "tile_pos_in_workspace_view": None,
+                "window_offset_in_tile": [0.0, 0.0],
+            },
+        }
+        for i in range(1, n_windows + 1)
+    ]
+    return {
+        "Workspaces": workspaces,
+        "Windows": windows,
+        "KeyboardLayouts": {"names": ["English (US)"], "current_idx": 0},
+    }
+
+
+def niri_flood(state: dict[str, Any], n_events: int) -> list[Step]:
+    """
+    A synthetic flood of Niri events: focus changes, workspace switches
+    and a full ``WindowsChanged`` every 100 events.
+    """
+    windows = state["Windows"]
+    workspaces = state["Workspaces"]
+    trace: list[Step] = []
+    for i in range(n_events):
+        if i % 100 == 99:
+            trace.append({"event": {"WindowsChanged": {"windows": windows}}})
+        elif i % 2:
+            ws = workspaces[i % len(workspaces)]
+            trace.append(
+                {"event": {"WorkspaceActivated": {"id": ws["id"], "focused": True}}}
+            )
+        else:
+            window = windows[i % len(windows)]
+            trace.append({"event": {"WindowFocusChanged": {"id": window["id"]}}})
+    return trace
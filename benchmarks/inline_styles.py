@@ -0,0 +1,112 @@
+"""
+Benchmark inline widget styles (the ``style`` property).
+
+Creates N labels with an inline style, either the same for all of them (``shared``)
+or a different one for each (``unique``), and prints the time spent creating them,
+the number of parsed ``Gtk.CssProvider`` objects and the growth of the resident memory.
+``--previous`` parses a separate provider for every widget, as before providers were shared.
+
+Requires Ignis, GTK 4 and a display (e.g., run it inside a Wayland session)::
+
+    python benchmarks/inline_styles.py --widgets 1000
+    python benchmarks/inline_styles.py --widgets 1000 --previous
+
+Every mode is run in a separate process, so memory measurements don't affect each other.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import time
+
+_MODES = ("shared", "unique")
+
+# a style of a realistic size, parsing a trivial one is too cheap to measure
+_STYLE = """
+* {{
+    padding: {i}px 8px;
+    margin: 2px;
+    border-radius: 6px;
+    background-color: rgba(40, 40, 40, 0.9);
+    color: #eeeeee;
+    font-size: 14px;
+}}
+"""
+
+
+def _get_rss() -> int:
+    # resident memory in bytes, Linux only
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def run(mode: str, n_widgets: int, previous: bool) -> None:
+    from gi.repository import Gtk  # type: ignore
+    from ignis import widgets
+    from ignis import base_widget
+    from ignis._deprecation import ignore_deprecation_warnings
+
+    styles = [_STYLE.format(i=i if mode == "unique" else 1) for i in range(n_widgets)]
+    # keep the providers alive, like widgets do
+    providers = []
+
+    gc.collect()
+    rss_before = _get_rss()
+    start = time.perf_counter()
+
+    labels = []
+    for i, style in enumerate(styles):
+        if previous:
+            label = widgets.Label(label=str(i))
+            provider = Gtk.CssProvider()
+            provider.load_from_string(style)
+            with ignore_deprecation_warnings():
+                label.get_style_context().add_provider(
+                    provider, Gtk.STYLE_PROVIDER_PRIORITY_USER
+                )
+            providers.append(provider)
+        else:
+            label = widgets.Label(label=str(i), style=style)
+        labels.append(label)
+
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    rss_delta = _get_rss() - rss_before
+
+    n_providers = (
+        len(providers) if previous else len(base_widget._style_providers._providers)
+    )
+    print(
+        f"{mode:8} {n_widgets} widgets: {elapsed * 1000:8.1f} ms, "
+        f"{n_providers:5} providers, RSS +{rss_delta / 1024 / 1024:.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--widgets", type=int, default=1000)
+    parser.add_argument(
+        "--previous",
+        action="store_true",
+        help="parse a separate provider for every widget",
+    )
+    parser.add_argument("--mode", choices=_MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.widgets, args.previous)
+        return
+
+    for mode in _MODES:
+        cmd = [sys.executable, __file__, "--mode", mode, "--widgets", str(args.widgets)]
+        if args.previous:
+            cmd.append("--previous")
+        subprocess.run(cmd, check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark :func:`ignis.utils.json_loads` and :func:`ignis.utils.json_dumps`
+with every installed backend (``orjson``, ``msgspec``, ``json``).
+
+Payloads are typical IPC messages: a Niri ``Windows`` reply, Hyprland ``clients``
+and a stream of small Niri events::
+
+    python benchmarks/json_codec.py --windows 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_compositor  # noqa: E402
+from _load import load_module  # noqa: E402
+
+json_codec = load_module("ignis_json_codec", "utils/json_codec.py")
+
+
+def _bench(func: Callable[[], object], repeat: int) -> float:
+    # the best of 5 runs of ``repeat`` calls, in microseconds per call
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--windows", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    niri = fake_compositor.niri_state(n_windows=args.windows)
+    hyprland = fake_compositor.hyprland_state(n_windows=args.windows)
+    events = [step["event"] for step in fake_compositor.niri_flood(niri, 1000)]
+
+    payloads = {
+        "niri Windows": json.dumps({"Ok": {"Windows": niri["Windows"]}}).encode(),
+        "hyprland clients": json.dumps(hyprland["clients"]).encode(),
+        "niri events x1000": [json.dumps(e).encode() for e in events],
+    }
+
+    for backend in ("orjson", "msgspec", "json"):
+        try:
+            json_codec.set_json_backend(backend)
+        except ImportError:
+            print(f"{backend}: not installed, skipped")
+            continue
+
+        print(f"{backend}:")
+        for name, payload in payloads.items():
+            # a single message, or a stream of small ones
+            lines = payload if isinstance(payload, list) else [payload]
+            objs = [json.loads(line) for line in lines]
+            repeat = max(args.repeat // len(lines), 1)
+
+            def loads(lines: list = lines) -> None:
+                for line in lines:
+                    json_codec.json_loads(line)
+
+            def dumps(objs: list = objs) -> None:
+                for obj in objs:
+                    json_codec.json_dumps(obj)
+
+            print(
+                f"  {name:20} loads {_bench(loads, repeat):10.1f} us"
+                f"  dumps {_bench(dumps, repeat):10.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark line framing of :func:`ignis.utils.listen_socket`.
+
+Compares the current implementation (receiving into a reusable buffer)
+with the previous one (concatenating bytes and splitting off one line at a time)
+on a flood of Hyprland-like event lines written in bursts::
+
+    python benchmarks/socket_framing.py --lines 200000 --burst 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_compositor  # noqa: E402
+from _load import load_module  # noqa: E402
+
+socket_utils = load_module("ignis_socket", "utils/socket.py")
+
+
+def listen_socket_previous(sock: socket.socket) -> Generator[str, None, None]:
+    # the implementation before the buffer was introduced
+    buffer = b""
+    while True:
+        new_data = sock.recv(8192)
+        if not new_data:
+            break
+        buffer += new_data
+        while b"\n" in buffer:
+            data, buffer = buffer.split(b"\n", 1)
+            yield data.decode("utf-8", errors="strict")
+
+
+def _payload(n_lines: int, burst: int) -> list[bytes]:
+    state = fake_compositor.hyprland_state()
+    events = [step["event"] for step in fake_compositor.hyprland_flood(state, 1000)]
+    lines = [f"{events[i % len(events)]}\n".encode() for i in range(n_lines)]
+    return [b"".join(lines[i : i + burst]) for i in range(0, n_lines, burst)]
+
+
+def _run(listen: Callable, chunks: list[bytes], expected: int) -> float:
+    reader, writer = socket.socketpair()
+
+    def write() -> None:
+        with writer:
+            for chunk in chunks:
+                writer.sendall(chunk)
+
+    thread = threading.Thread(target=write)
+    start = time.perf_counter()
+    thread.start()
+    with reader:
+        count = sum(1 for _ in listen(reader))
+    elapsed = time.perf_counter() - start
+    thread.join()
+
+    assert count == expected, (count, expected)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--burst", type=int, default=64, help="lines per write")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    chunks = _payload(args.lines, args.burst)
+    for name, listen in (
+        ("previous", listen_socket_previous),
+        ("current", socket_utils.listen_socket),
+    ):
+        best = min(_run(listen, chunks, args.lines) for _ in range(args.repeat))
+        print(f"{name:10} {best * 1000:8.1f} ms  {args.lines / best:12.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+import os
+import atexit
+import queue
+import weakref
+import threading
+from typing import Any
+from loguru import logger
+from ignis import utils
+
+_journals: "weakref.WeakSet[Journal]" = weakref.WeakSet()
+
+
+def _flush_all() -> None:
+    for journal in list(_journals):
+        journal.flush()
+
+
+atexit.register(_flush_all)
+
+
+class Journal:
+    """
+    :meta private:
+
+    An append-only JSON Lines store of records identified by their ``"id"`` key.
+
+    Every :func:`add` and :func:`remove` appends a single line to the file
+    instead of rewriting it, the writing happens on a background thread.
+    Once the file contains more stale lines than live records,
+    it is compacted (atomically rewritten with only the live records).
+
+    Lines:
+        - ``{"add": {...}}``: a record was added (or replaced, if the ID already exists).
+        - ``{"remove": ID}``: a record was removed.
+        - ``{"last_id": ID}``: the largest ID ever added, written on compaction.
+
+    Args:
+        path: The path to the journal file.
+        compact_threshold: The minimum number of stale lines before compacting.
+    """
+
+    def __init__(self, path: str, compact_threshold: int = 256) -> None:
+        self._path = path
+        self._compact_threshold = compact_threshold
+
+        self._records: dict[int, dict[str, Any]] = {}
+        self._last_id = 0
+        self._lines = 0
+
+        self._queue: queue.Queue[tuple[str, Any]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+        _journals.add(self)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def records(self) -> list[dict[str, Any]]:
+        """
+        Live records, in the order they were added.
+        """
+        return list(self._records.values())
+
+    @property
+    def last_id(self) -> int:
+        """
+        The largest ID ever added, including removed records.
+        """
+        return self._last_id
+
+    def exists(self) -> bool:
+        return os.path.exists(self._path)
+
+    def load(self) -> None:
+        """
+        Read the journal file. Invalid lines (e.g., a line truncated by a crash) are skipped.
+        """
+        self._records.clear()
+        self._lines = 0
+        broken = 0
+
+        try:
+            with open(self._path, "rb") as file:
+                lines = file.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            if not line:
+                continue
+
+            try:
+                entry = utils.json_loads(line)
+                if "add" in entry:
+                    record = entry["add"]
+                    self.__put(record)
+                elif "remove" in entry:
+                    self._records.pop(entry["remove"], None)
+                elif "last_id" in entry:
+                    self._last_id = max(self._last_id, entry["last_id"])
+            except Exception:
+                broken += 1
+                continue
+
+            self._lines += 1
+
+        if broken:
+            logger.warning(f"Skipped {broken} corrupted lines in {self._path}")
+            self.compact()
+        else:
+            self.__maybe_compact()
+
+    def reset(self, records: list[dict[str, Any]], last_id: int = 0) -> None:
+        """
+        Replace all records and rewrite the file.
+        """
+        self._records.clear()
+        self._last_id = last_id
+        for record in records:
+            self.__put(record)
+        self.compact()
+
+    def add(self, record: dict[str, Any]) -> None:
+        """
+        Add a record. The record must not be modified afterwards.
+        """
+        self.__put(record)
+        self.__submit("append", {"add": record})
+
+    def remove(self, id: int) -> None:
+        if self._records.pop(id, None) is None:
+            return
+
+        self.__submit("append", {"remove": id})
+        self.__maybe_compact()
+
+    def compact(self) -> None:
+        self._lines = len(self._records) + 1
+        self.__submit("compact", (self._last_id, self.records))
+
+    def flush(self) -> None:
+        """
+        Block until all pending writes are done.
+        """
+        self._queue.join()
+
+    def __put(self, record: dict[str, Any]) -> None:
+        self._records[record["id"]] = record
+        self._last_id = max(self._last_id, record["id"])
+
+    def __maybe_compact(self) -> None:
+        stale = self._lines - len(self._records)
+        if stale > max(self._compact_threshold, len(self._records)):
+            self.compact()
+
+    def __submit(self, op: str, data: Any) -> None:
+        if op == "append":
+            self._lines += 1
+
+        self._queue.put((op, data))
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.__run, daemon=True)
+            self._thread.start()
+
+    def __run(self) -> None:
+        while True:
+            ops = [self._queue.get()]
+            # write everything queued so far at once
+            while True:
+                try:
+                    ops.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.__write(ops)
+            except OSError as e:
+                logger.warning(f"Failed to write {self._path}: {e}")
+            except Exception as e:
+                # e.g., a record that can't be serialized, the thread must keep running for later writes
+                logger.error(f"Failed to write {self._path}: {e}")
+            finally:
+                for _ in ops:
+                    self._queue.task_done()
+
+    def __write(self, ops: list[tuple[str, Any]]) -> None:
+        lines: list[str] = []
+
+        for op, data in ops:
+            if op == "append":
+                lines.append(utils.json_dumps(data))
+            else:
+                # anything queued before the compaction is already included in it
+                last_id, records = data
+                lines = [utils.json_dumps({"last_id": last_id})]
+                lines.extend(utils.json_dumps({"add": r}) for r in records)
+                self.__rewrite(lines)
+                lines = []
+
+        if lines:
+            with open(self._path, "a") as file:
+                file.write("\n".join(lines) + "\n")
+
+    def __rewrite(self, lines: list[str]) -> None:
+        # write to a temporary file and rename it, so the file is never left half-written
+        tmp_file = f"{self._path}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(tmp_file, self._path)
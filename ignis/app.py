@@ -24,6 +24,8 @@ from ignis._deprecation import (
     deprecation_warning,
 )
 from ignis._ignis_ipc import IgnisIpc
+from ignis.options_manager import _flush_all as _flush_all_options
+from ignis._journal import _flush_all as _flush_all_journals
 
 window_manager = WindowManager.get_default()
 config_manager = ConfigManager.get_default()
@@ -147,6 +149,10 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         """
         Quit Ignis.
         """
+        # reload() replaces the process right after quitting, so atexit handlers won't run
+        _flush_all_options()
+        _flush_all_journals()
+
         if ignis._temp_dir:
             logger.debug(f"Removing temp dir: {ignis._temp_dir}")
             try:
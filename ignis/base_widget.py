@@ -1,3 +1,4 @@
+import weakref
 from gi.repository import Gtk, GObject  # type: ignore
 from typing import Any
 from collections.abc import Callable
@@ -11,6 +12,41 @@ from ignis.css_manager import (
 )
 
 
+class _StyleProviderCache:
+    """
+    Shares one parsed ``Gtk.CssProvider`` between all widgets that use the same inline style.
+    Providers are reference counted and dropped once no widget uses them.
+    """
+
+    def __init__(self) -> None:
+        self._providers: dict[str, tuple[Gtk.CssProvider, int]] = {}
+
+    def acquire(self, style: str) -> Gtk.CssProvider:
+        provider, refcount = self._providers.get(style, (None, 0))
+
+        if provider is None:
+            provider = Gtk.CssProvider()
+            provider.connect("parsing-error", _raise_css_parsing_error)
+            provider.load_from_string(style)
+
+        self._providers[style] = provider, refcount + 1
+        return provider
+
+    def release(self, style: str) -> None:
+        provider, refcount = self._providers.get(style, (None, 0))
+
+        if provider is None:
+            return
+
+        if refcount <= 1:
+            del self._providers[style]
+        else:
+            self._providers[style] = provider, refcount - 1
+
+
+_style_providers = _StyleProviderCache()
+
+
 class BaseWidget(Gtk.Widget, IgnisGObject):
     """
     Bases: :class:`~ignis.gobject.IgnisGObject`.
@@ -35,6 +71,8 @@ class BaseWidget(Gtk.Widget, IgnisGObject):
 
         self._style: str | None = None
         self._css_provider: Gtk.CssProvider | None = None
+        self._css_provider_priority: StylePriority | None = None
+        self._css_provider_release: weakref.finalize | None = None
 
         css_manager = CssManager.get_default()
         self._style_priority: StylePriority = (
@@ -61,17 +99,21 @@ class BaseWidget(Gtk.Widget, IgnisGObject):
 
     @style.setter
     def style(self, value: str) -> None:
+        if "{" not in value and "}" not in value:
+            value = "* {" + value + "}"
+
+        if value == self._style and self._css_provider_priority == self._style_priority:
+            return
+
         if self._css_provider:
             with ignore_deprecation_warnings():
                 self.get_style_context().remove_provider(self._css_provider)
 
-        if "{" not in value and "}" not in value:
-            value = "* {" + value + "}"
+        if self._css_provider_release:
+            self._css_provider_release()
 
-        css_provider = Gtk.CssProvider()
-        css_provider.connect("parsing-error", _raise_css_parsing_error)
-
-        css_provider.load_from_string(value)
+        # widgets with identical inline styles share a single parsed provider
+        css_provider = _style_providers.acquire(value)
 
         with ignore_deprecation_warnings():
             self.get_style_context().add_provider(
@@ -79,6 +121,10 @@ class BaseWidget(Gtk.Widget, IgnisGObject):
             )
 
         self._css_provider = css_provider
+        self._css_provider_priority = self._style_priority
+        self._css_provider_release = weakref.finalize(
+            self, _style_providers.release, value
+        )
         self._style = value
 
     @IgnisProperty
@@ -0,0 +1,276 @@
+import bisect
+from typing import Any, Generic, TypeVar
+from collections.abc import Callable, Hashable, Iterator
+from gi.repository import Gio, GLib, GObject  # type: ignore
+from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V", bound=GObject.Object)
+
+
+class IgnisCollection(IgnisGObject, Gio.ListModel, Generic[K, V]):
+    """
+    Bases: :class:`~ignis.gobject.IgnisGObject`, :class:`Gio.ListModel`
+
+    An ordered collection of GObjects identified by keys,
+    which reports changes item by item.
+
+    It implements ``Gio.ListModel`` and emits ``items-changed`` with exact positions,
+    so it can be used directly as a model for :class:`~ignis.widgets.ListView`,
+    :class:`~ignis.widgets.GridView` or any GTK list widget.
+
+    The list returned by :attr:`items` is cached and rebuilt only after the collection changes,
+    so reading it repeatedly (e.g., from bindings) is cheap.
+    Instead of rebuilding everything on ``notify::items``,
+    consumers can apply the :attr:`added`, :attr:`removed` and :attr:`moved` signals one by one
+    to keep their own list (e.g., of widgets) in sync.
+
+    Args:
+        sort_key: A function returning the sort key of an item.
+            If not provided, items are kept in insertion order.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from ignis.services.notifications import NotificationService
+
+        notifications = NotificationService.get_default()
+        collection = notifications.notifications_collection
+
+        collection.connect("added", lambda x, item, position: print("added", item.summary, "at", position))
+        collection.connect("removed", lambda x, item, position: print("removed", item.summary, "from", position))
+    """
+
+    def __init__(self, sort_key: Callable[[V], Any] | None = None):
+        super().__init__()
+        self._sort_key = sort_key
+        self._items: dict[K, V] = {}
+        self._keys: list[K] = []
+        # sort keys of self._keys, in the same order
+        self._sort_keys: list[Any] = []
+        self._snapshot: list[V] | None = None
+        self._notify_pending = False
+
+    @IgnisSignal
+    def added(self, item: GObject.Object, position: int):
+        """
+        Emitted when an item has been added.
+
+        Args:
+            item: The added item.
+            position: The position of the item.
+        """
+
+    @IgnisSignal
+    def removed(self, item: GObject.Object, position: int):
+        """
+        Emitted when an item has been removed.
+
+        Args:
+            item: The removed item.
+            position: The position the item had.
+        """
+
+    @IgnisSignal
+    def moved(self, item: GObject.Object, old_position: int, new_position: int):
+        """
+        Emitted when an item has changed its position (only if ``sort_key`` is set).
+
+        Args:
+            item: The moved item.
+            old_position: The previous position of the item.
+            new_position: The new position of the item, after it has been removed from the old one.
+        """
+
+    @IgnisProperty
+    def items(self) -> list[V]:
+        """
+        All items, in order.
+
+        The returned list is shared between calls and must not be modified.
+        """
+        if self._snapshot is None:
+            self._snapshot = [self._items[key] for key in self._keys]
+        return self._snapshot
+
+    @IgnisProperty
+    def sort_key(self) -> Callable[[V], Any] | None:
+        """
+        The function returning the sort key of an item, or ``None`` for insertion order.
+        """
+        return self._sort_key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __iter__(self) -> Iterator[V]:
+        return iter(self.items)
+
+    def keys(self) -> list[K]:
+        """
+        Get all keys, in order.
+        """
+        return list(self._keys)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """
+        Get an item by its key.
+
+        Args:
+            key: The key of the item.
+            default: The value to return if there is no such item.
+        """
+        return self._items.get(key, default)
+
+    def get_position(self, key: K) -> int:
+        """
+        Get the position of an item.
+
+        Args:
+            key: The key of the item.
+
+        Raises:
+            KeyError: If there is no item with this key.
+        """
+        if key not in self._items:
+            raise KeyError(key)
+
+        return self.__find_position(key)
+
+    def set(self, key: K, item: V) -> None:
+        """
+        Add an item, or replace the item with the same key.
+
+        Args:
+            key: The key of the item.
+            item: The item.
+        """
+        old_item = self._items.get(key)
+        if old_item is item:
+            return
+
+        if old_item is not None:
+            self.remove(key)
+
+        self._items[key] = item
+
+        if self._sort_key is None:
+            position = len(self._keys)
+        else:
+            sort_key = self._sort_key(item)
+            position = bisect.bisect_right(self._sort_keys, sort_key)
+            self._sort_keys.insert(position, sort_key)
+
+        self._keys.insert(position, key)
+        self._snapshot = None
+
+        self.items_changed(position, 0, 1)
+        self.emit("added", item, position)
+        self.__notify_items()
+
+    def remove(self, key: K) -> V | None:
+        """
+        Remove an item.
+
+        Args:
+            key: The key of the item.
+
+        Returns:
+            The removed item, or ``None`` if there was no item with this key.
+        """
+        if key not in self._items:
+            return None
+
+        position = self.__find_position(key)
+        item = self._items.pop(key)
+        del self._keys[position]
+        if self._sort_key is not None:
+            del self._sort_keys[position]
+        self._snapshot = None
+
+        self.items_changed(position, 1, 0)
+        self.emit("removed", item, position)
+        self.__notify_items()
+        return item
+
+    def clear(self) -> None:
+        """
+        Remove all items.
+        """
+        for key in reversed(self._keys[:]):
+            self.remove(key)
+
+    def resort(self, key: K) -> None:
+        """
+        Update the position of an item after its sort key has changed.
+        Does nothing if ``sort_key`` is not set.
+
+        Args:
+            key: The key of the item.
+        """
+        if self._sort_key is None or key not in self._items:
+            return
+
+        old_position = self.__find_position(key)
+        sort_key = self._sort_key(self._items[key])
+        if self._sort_keys[old_position] == sort_key:
+            return
+
+        del self._keys[old_position]
+        del self._sort_keys[old_position]
+
+        new_position = bisect.bisect_right(self._sort_keys, sort_key)
+        self._keys.insert(new_position, key)
+        self._sort_keys.insert(new_position, sort_key)
+
+        if new_position == old_position:
+            return
+
+        self._snapshot = None
+        # the range between both positions is shifted by one
+        start = min(old_position, new_position)
+        count = abs(old_position - new_position) + 1
+        self.items_changed(start, count, count)
+        self.emit("moved", self._items[key], old_position, new_position)
+        self.__notify_items()
+
+    def do_get_item_type(self) -> GObject.GType:
+        """
+        :meta private:
+        """
+        return GObject.Object.__gtype__
+
+    def do_get_n_items(self) -> int:
+        """
+        :meta private:
+        """
+        return len(self._keys)
+
+    def do_get_item(self, position: int) -> GObject.Object | None:
+        """
+        :meta private:
+        """
+        if 0 <= position < len(self._keys):
+            return self._items[self._keys[position]]
+        return None
+
+    def __notify_items(self) -> None:
+        # many changes in a row (e.g., clear()) are notified once
+        if self._notify_pending:
+            return
+
+        def callback() -> bool:
+            self._notify_pending = False
+            GObject.Object.notify(self, "items")
+            return False
+
+        self._notify_pending = True
+        GLib.idle_add(callback)
+
+    def __find_position(self, key: K) -> int:
+        # the sort key of the item may have changed since it was inserted, so don't bisect
+        return self._keys.index(key)
@@ -1,4 +1,6 @@
 import os
+import time
+import asyncio
 from gi.repository import Gtk, GLib  # type: ignore
 from dataclasses import dataclass
 from ignis.gobject import IgnisGObjectSingleton, IgnisProperty, IgnisSignal
@@ -24,6 +26,10 @@ GTK_STYLE_PRIORITIES: dict[StylePriority, int] = {
 }
 
 
+# Delay before reloading a CSS info after one of its files has changed
+_RELOAD_DEBOUNCE_MS = 100
+
+
 def _raise_css_parsing_error(_, section: Gtk.CssSection, gerror: GLib.Error) -> None:
     raise CssParsingError(section, gerror)
 
@@ -98,6 +104,18 @@ class CssInfoPath(CssInfoBase):
     #: Whether to watch the directory recursively.
     watch_recursively: bool = True
 
+    #: Whether to reload this info only when a file it (transitively) imports changes,
+    #: instead of on any change of a style file in the watched directory.
+    #: The imports are resolved by :func:`~ignis.utils.get_sass_dependencies`.
+    #:
+    #: With :attr:`~CssInfoBase.compiler_function`, dependencies are tracked only if :attr:`load_paths` is set,
+    #: because the compiler may resolve imports through load paths unknown to Ignis.
+    track_dependencies: bool = True
+
+    #: Load paths (``--load-path``) the :attr:`~CssInfoBase.compiler_function` passes to the Sass compiler,
+    #: used to resolve imports for :attr:`track_dependencies`. Set it to an empty list if there are none.
+    load_paths: list[str] | None = None
+
     def _get_type(self) -> str:
         return "path"
 
@@ -162,6 +180,8 @@ class CssManager(IgnisGObjectSingleton):
                 name="main",
                 path="PATH/TO/style.scss",
                 compiler_function=lambda path: utils.sass_compile(path=path),
+                # no load paths are used, so only changes of imported files trigger a reload
+                load_paths=[],
             )
         )
 
@@ -181,6 +201,9 @@ class CssManager(IgnisGObjectSingleton):
         ] = {}
 
         self._watchers: dict[str, utils.FileMonitor] = {}
+        self._dependencies: dict[str, set[str] | None] = {}
+        self._reload_tasks: dict[str, utils.DebounceTask] = {}
+        self._reload_generations: dict[str, int] = {}
 
         self._widgets_style_priority: StylePriority = "application"
 
@@ -192,8 +215,39 @@ class CssManager(IgnisGObjectSingleton):
 
         if not os.path.isdir(path) and "__pycache__" not in path:
             extension = os.path.splitext(path)[1]
-            if extension in (".css", ".scss", ".sass"):
-                self.reload_css(name)
+            if extension not in (".css", ".scss", ".sass"):
+                return
+
+            dependencies = self._dependencies.get(name, None)
+            if dependencies is not None and os.path.realpath(path) not in dependencies:
+                return
+
+            # editors often write a file several times in a row on save
+            self._reload_tasks[name].run()
+
+    def __update_dependencies(self, info: CssInfoPath) -> None:
+        # imports of a custom compiler may be resolved through unknown load paths
+        if not info.track_dependencies or (
+            info.compiler_function and info.load_paths is None
+        ):
+            self._dependencies[info.name] = None
+            return
+
+        extra_args: list[str] = []
+        for load_path in info.load_paths or []:
+            extra_args.extend(("--load-path", load_path))
+
+        try:
+            # imports that don't exist yet are tracked too, so creating them triggers a reload
+            self._dependencies[info.name] = {
+                os.path.realpath(dep)
+                for dep in utils.get_sass_dependencies(
+                    path=info.path, extra_args=extra_args, include_unresolved=True
+                )
+            }
+        except (OSError, UnicodeDecodeError):
+            # reload on any change until the dependencies can be resolved
+            self._dependencies[info.name] = None
 
     def __start_watching(self, info: CssInfoPath) -> None:
         watch_path: str
@@ -203,6 +257,12 @@ class CssManager(IgnisGObjectSingleton):
         else:
             watch_path = info.path
 
+        self.__update_dependencies(info)
+        self._reload_tasks[info.name] = utils.DebounceTask(
+            ms=_RELOAD_DEBOUNCE_MS,
+            target=lambda name=info.name: self.__reload_watched(name),
+        )
+
         self._watchers[info.name] = utils.FileMonitor(
             path=watch_path,
             recursive=info.watch_recursively,
@@ -212,6 +272,26 @@ class CssManager(IgnisGObjectSingleton):
             ),
         )
 
+    def __reload_watched(self, name: str) -> None:
+        # the info could be removed while the reload was pending
+        if name in self._css_infos:
+            asyncio.create_task(self.__reload_watched_async(name))
+
+    async def __reload_watched_async(self, name: str) -> None:
+        try:
+            await self.reload_css_async(name)
+        except CssInfoNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(
+                f'Failed to reload CSS info "{name}", keeping the old style: {e}'
+            )
+
+            # the failure could be caused by a new import, watch it
+            info, _ = self._css_infos.get(name, (None, None))
+            if isinstance(info, CssInfoPath):
+                self.__update_dependencies(info)
+
     def __stop_watching(self, name: str) -> None:
         file_monitor = self._watchers.pop(name, None)
 
@@ -219,6 +299,10 @@ class CssManager(IgnisGObjectSingleton):
             raise CssInfoNotFoundError(name)
 
         file_monitor.cancel()
+        self._dependencies.pop(name, None)
+        reload_task = self._reload_tasks.pop(name, None)
+        if reload_task:
+            reload_task.cancel()
 
     @IgnisSignal
     def css_applied(self, info: object):
@@ -253,6 +337,17 @@ class CssManager(IgnisGObjectSingleton):
             info(CssInfoString | CssInfoPath): The reloaded CSS.
         """
 
+    @IgnisSignal
+    def css_reload_finished(self, info: object, compile_time: float, apply_time: float):
+        """
+        Emitted after :attr:`css_reloaded` with the timing of the reload.
+
+        Args:
+            info(CssInfoString | CssInfoPath): The reloaded CSS.
+            compile_time: The time spent compiling the CSS (e.g., Sass), in milliseconds.
+            apply_time: The time spent parsing and applying the CSS, in milliseconds.
+        """
+
     @IgnisSignal
     def all_css_reloaded(self):
         """
@@ -302,10 +397,38 @@ class CssManager(IgnisGObjectSingleton):
         if info.name in self._css_infos:
             raise CssInfoAlreadyAppliedError(info.name)
 
+        self.__apply_string(info, info._get_string())
+
+    async def apply_css_async(self, info: CssInfoString | CssInfoPath) -> None:
+        """
+        Asynchronously apply a CSS info.
+
+        The same as :func:`apply_css`, but the CSS is compiled (e.g., by :attr:`CssInfoBase.compiler_function`)
+        in another thread, so the main loop is not blocked.
+
+        Args:
+            info: The CSS info to apply.
+
+        Raises:
+            CssInfoAlreadyAppliedError: If CSS info with the given name is already applied.
+            CssParsingError: If a CSS parsing error occurs, usually due to invalid CSS.
+        """
+        if info.name in self._css_infos:
+            raise CssInfoAlreadyAppliedError(info.name)
+
+        string = await asyncio.to_thread(info._get_string)
+
+        # could be applied while compiling
+        if info.name in self._css_infos:
+            raise CssInfoAlreadyAppliedError(info.name)
+
+        self.__apply_string(info, string)
+
+    def __apply_string(self, info: CssInfoString | CssInfoPath, string: str) -> None:
         provider = Gtk.CssProvider()
         provider.connect("parsing-error", _raise_css_parsing_error)
 
-        provider.load_from_string(info._get_string())
+        provider.load_from_string(string)
 
         Gtk.StyleContext.add_provider_for_display(
             utils.get_gdk_display(),
@@ -374,10 +497,91 @@ class CssManager(IgnisGObjectSingleton):
         if not info:
             raise CssInfoNotFoundError(name)
 
+        start = time.perf_counter()
+
         self.remove_css(name)
         self.apply_css(info)
 
+        elapsed = (time.perf_counter() - start) * 1000
+
         self.emit("css-reloaded", info)
+        # compilation and applying are not separated in the synchronous reload
+        self.emit("css-reload-finished", info, 0.0, elapsed)
+        logger.info(f'Reloaded CSS info: "{name}" in {elapsed:.1f} ms')
+
+    async def reload_css_async(self, name: str) -> None:
+        """
+        Asynchronously reload a CSS info by its name.
+
+        The CSS is compiled in another thread, so the main loop is not blocked.
+        The old style stays applied until the new one is successfully compiled and parsed,
+        then they are swapped at once.
+        If compilation or parsing fails, the old style is kept and the exception is raised.
+
+        If the info is reloaded again while compiling, only the latest reload is applied.
+
+        Args:
+            name: The name of the CSS info to reload.
+
+        Raises:
+            CssInfoNotFoundError: If no CSS info with the given name is found.
+            CssParsingError: If a CSS parsing error occurs, usually due to invalid CSS.
+        """
+        logger.info(f'Reloading CSS info: "{name}"')
+
+        info, _ = self._css_infos.get(name, (None, None))
+
+        if not info:
+            raise CssInfoNotFoundError(name)
+
+        generation = self._reload_generations.get(name, 0) + 1
+        self._reload_generations[name] = generation
+
+        start = time.perf_counter()
+        string = await asyncio.to_thread(info._get_string)
+        compile_time = (time.perf_counter() - start) * 1000
+
+        # removed, or a newer reload was started while compiling
+        if (
+            self._css_infos.get(name, (None, None))[0] is not info
+            or self._reload_generations.get(name) != generation
+        ):
+            return
+
+        start = time.perf_counter()
+
+        errors: list[CssParsingError] = []
+        provider = Gtk.CssProvider()
+        provider.connect(
+            "parsing-error",
+            lambda _, section, gerror: errors.append(CssParsingError(section, gerror)),
+        )
+        provider.load_from_string(string)
+
+        if errors:
+            raise errors[0]
+
+        display = utils.get_gdk_display()
+        _, old_provider = self._css_infos[name]
+
+        # add the new provider before removing the old one, so there is no unstyled frame
+        Gtk.StyleContext.add_provider_for_display(
+            display, provider, GTK_STYLE_PRIORITIES[info.priority]
+        )
+        Gtk.StyleContext.remove_provider_for_display(display, old_provider)
+        self._css_infos[name] = info, provider
+
+        if isinstance(info, CssInfoPath) and info.autoreload:
+            self.__update_dependencies(info)
+
+        apply_time = (time.perf_counter() - start) * 1000
+
+        self.emit("css-reloaded", info)
+        self.emit("css-reload-finished", info, compile_time, apply_time)
+        logger.info(
+            f'Reloaded CSS info: "{name}" in {compile_time + apply_time:.1f} ms '
+            f"(compile: {compile_time:.1f} ms, apply: {apply_time:.1f} ms)"
+        )
 
     def reload_all_css(self) -> None:
         """
@@ -390,6 +594,20 @@ class CssManager(IgnisGObjectSingleton):
 
         self.emit("all-css-reloaded")
 
+    async def reload_all_css_async(self) -> None:
+        """
+        Asynchronously reload **all** applied CSS infos.
+
+        All infos are compiled concurrently, see :func:`reload_css_async`.
+        """
+        logger.info("Reloading all CSS infos...")
+
+        await asyncio.gather(
+            *(self.reload_css_async(name) for name in self._css_infos.copy().keys())
+        )
+
+        self.emit("all-css-reloaded")
+
     def get_css_info_by_name(self, name: str) -> CssInfoPath | CssInfoString | None:
         """
         Get an applied CSS info by its name:
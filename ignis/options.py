@@ -118,6 +118,36 @@ class Options(OptionsManager):
         #: If the length of the ``popups`` list exceeds ``max_popups_count``, the oldest popup will be dismissed.
         max_popups_count: int = 3
 
+        #: The maximum number of notifications kept in the history.
+        #:
+        #: When exceeded, the oldest notifications are closed. ``0`` means no limit.
+        max_history_count: int = 1000
+
+        #: The maximum age of notifications in the history, in seconds.
+        #:
+        #: Older notifications are closed. ``0`` means no limit.
+        max_history_age: int = 0
+
+        #: The maximum number of notifications kept in the history per application.
+        #:
+        #: When exceeded, the oldest notifications of this application are closed. ``0`` means no limit.
+        max_history_per_app: int = 0
+
+        #: The maximum width and height of images sent as raw data (``image-data`` hint), in pixels.
+        #:
+        #: Larger images are downscaled before saving, preserving the aspect ratio. ``0`` means no limit.
+        max_image_size: int = 256
+
+        #: The maximum sustained number of notifications per second from a single application.
+        #:
+        #: Notifications exceeding it are merged into the latest notification of the application,
+        #: which is updated in place and has its :attr:`~ignis.services.notifications.Notification.count` increased.
+        #: ``0`` disables rate limiting.
+        rate_limit: float = 2
+
+        #: The number of notifications an application can send at once before :attr:`rate_limit` applies.
+        rate_limit_burst: int = 10
+
     class Recorder(OptionsGroup):
         """
         Options for the :class:`~ignis.services.recorder.RecorderService`.
@@ -203,6 +233,26 @@ class Options(OptionsManager):
         #: A list of the pinned applications desktop files, e.g. ``"firefox.desktop"``, ``"code.desktop"``.
         pinned_apps: TrackedList[str] = TrackedList()
 
+        #: The number of the most frequently launched applications whose icons are loaded on startup,
+        #: so launchers showing them open without delay. ``0`` to disable.
+        preload_icons_count: int = 10
+
+        #: The size of the preloaded icons, in pixels.
+        preload_icons_size: int = 48
+
+    class Mpris(OptionsGroup):
+        """
+        Options for the :class:`~ignis.services.mpris.MprisService`.
+        """
+
+        #: The maximum width and height of cached art images, in pixels. Larger images are downscaled.
+        #: ``0`` to store images at full resolution.
+        art_max_size: int = 512
+
+        #: The maximum total size of cached art images, in megabytes.
+        #: The least recently used images are removed first.
+        art_cache_max_size: int = 100
+
     class Wallpaper(OptionsGroup):
         """
         Options for the :class:`~ignis.services.wallpaper.WallpaperService`.
@@ -214,6 +264,7 @@ class Options(OptionsManager):
     notifications = Notifications()
     recorder = Recorder()
     applications = Applications()
+    mpris = Mpris()
     wallpaper = Wallpaper()
 
 
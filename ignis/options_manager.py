@@ -1,4 +1,9 @@
-import json
+import os
+import atexit
+import weakref
+import threading
+from collections import deque
+from contextlib import contextmanager
 from ignis.gobject import IgnisGObject, Binding, IgnisProperty, IgnisSignal
 from ignis import utils
 from typing import Any, TypeVar
@@ -8,6 +13,36 @@ from ignis import is_sphinx_build
 
 T = TypeVar("T")
 
+# Delay before autosaving, consecutive changes within it are written at once
+_AUTOSAVE_DEBOUNCE_MS = 200
+
+_managers: "weakref.WeakSet[OptionsManager]" = weakref.WeakSet()
+
+
+def _write_atomic(file: str, content: str) -> None:
+    # write to a temporary file and rename it, so the file is never left half-written
+    tmp_file = f"{file}.{os.getpid()}.tmp"
+    with open(tmp_file, "w") as fp:
+        fp.write(content)
+    os.replace(tmp_file, file)
+
+
+def _to_json_value(value: Any) -> Any:
+    # the value as it would be after saving to and loading from the file
+    if isinstance(value, list | tuple):
+        return [_to_json_value(i) for i in value]
+    if isinstance(value, dict):
+        return {str(k): _to_json_value(v) for k, v in value.items()}
+    return value
+
+
+def _flush_all() -> None:
+    for manager in list(_managers):
+        manager.flush()
+
+
+atexit.register(_flush_all)
+
 
 class TrackedList(list[T]):
     """
@@ -26,6 +61,15 @@ class TrackedList(list[T]):
         group = SomeGroup()
         group.connect_option("some_list", lambda: print(f"changed!: {group.some_list}"))
         group.some_list.append(123)
+
+    Use :func:`batch` to make many changes at once with a single notification:
+
+    .. code-block:: python
+
+        with group.some_list.batch():
+            group.some_list.clear()
+            for i in range(100):
+                group.some_list.append(i)
     """
 
     def __init__(
@@ -34,6 +78,8 @@ class TrackedList(list[T]):
         super().__init__(*args)
         self._owner = owner
         self._name = name
+        self._batch_depth = 0
+        self._batch_changed = False
 
     @property
     def owner(self) -> "OptionsGroup | None":
@@ -43,7 +89,30 @@ class TrackedList(list[T]):
     def name(self) -> str | None:
         return self._name
 
+    @contextmanager
+    def batch(self) -> Generator["TrackedList[T]", None, None]:
+        """
+        A context manager that defers notifications until the end of the block.
+        The owner group is notified (and the options are autosaved) only once,
+        and only if the list was actually modified. Batches can be nested.
+
+        Returns:
+            This list.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_changed:
+                self._batch_changed = False
+                self.__notify()
+
     def __notify(self) -> None:
+        if self._batch_depth > 0:
+            self._batch_changed = True
+            return
+
         if self._owner and self._name:
             obj = self._owner._instance
             new_list: TrackedList = TrackedList(self._owner, self._name, self)
@@ -181,6 +250,18 @@ class OptionsGroup(IgnisGObject):
             option_name: The name of the option.
         """
 
+    @IgnisSignal
+    def subgroup_options_changed(self, subgroup_name: str, option_names: list):
+        """
+        Emitted once per subgroup when its options are changed together
+        (e.g., when the options file is hot-reloaded),
+        in addition to :attr:`subgroup_changed` for every option.
+
+        Args:
+            subgroup_name: The name of the subgroup.
+            option_names(list[str]): The names of the changed options.
+        """
+
     @IgnisSignal
     def autosave(self):
         """
@@ -268,6 +349,37 @@ class OptionsGroup(IgnisGObject):
                         value = TrackedList(attr.owner, attr.name, value)
                     self.__setattr__(key, value, emit, autosave)
 
+    def _apply_diff_from_dict(self, data: dict[str, Any]) -> list[str]:
+        """
+        Like :func:`apply_from_dict`, but compares values the way they are stored in the file,
+        so only options that actually differ are set and notified.
+        Emits :attr:`subgroup_options_changed` once for every changed subgroup.
+        Never triggers autosave.
+
+        Returns:
+            The names of changed options of this group (not including subgroups).
+        """
+        changed: list[str] = []
+
+        for key, value in data.items():
+            if not hasattr(self, key):
+                continue
+
+            attr = getattr(self, key)
+
+            if isinstance(attr, OptionsGroup):
+                if isinstance(value, dict):
+                    subgroup_changed = attr._apply_diff_from_dict(value)
+                    if subgroup_changed:
+                        self.emit("subgroup-options-changed", key, subgroup_changed)
+            elif _to_json_value(attr) != value:
+                if isinstance(attr, TrackedList) and isinstance(value, list):
+                    value = TrackedList(attr.owner, attr.name, value)
+                self.__setattr__(key, value, True, False)
+                changed.append(key)
+
+        return changed
+
     def __yield_subgroups(
         self,
     ) -> Generator[tuple[str, "OptionsGroup"], None, None]:
@@ -351,6 +463,17 @@ class OptionsManager(OptionsGroup):
         super().__init__()
         self._file = file
 
+        # the content last written to (or read from) the file
+        self._saved_content: str | None = None
+        self._pending_content: str | None = None
+        # recently written contents, to ignore file monitor events caused by our own writes
+        self._written_contents: deque[str] = deque(maxlen=8)
+        self._save_lock = threading.Lock()
+        self._autosave_pending = False
+        self._autosave_task = utils.DebounceTask(
+            ms=_AUTOSAVE_DEBOUNCE_MS, target=self.__save
+        )
+
         if not is_sphinx_build and self._file is not None:
             self.connect("autosave", self.__autosave)
 
@@ -359,6 +482,8 @@ class OptionsManager(OptionsGroup):
             if hot_reload:
                 utils.FileMonitor(path=self._file, callback=self.__hot_reload)
 
+            _managers.add(self)
+
     def __hot_reload(self, x, path: str, event_type: str) -> None:
         if not self._file:
             return
@@ -367,12 +492,66 @@ class OptionsManager(OptionsGroup):
             return
 
         with open(self._file) as fp:
-            data = json.load(fp)
+            content = fp.read()
 
-        self.apply_from_dict(data, autosave=False)
+        # triggered by our own save, or nothing has actually changed
+        if content == self._saved_content or content in self._written_contents:
+            return
+
+        self._saved_content = content
+        # only options edited externally are set and notified
+        self._apply_diff_from_dict(utils.json_loads(content))
 
     def __autosave(self, *args) -> None:
-        self.save_to_file(self._file)  # type: ignore
+        self._autosave_pending = True
+        self._autosave_task.run()
+
+    def __serialize(self) -> str:
+        return utils.json_dumps(self.get_modified_options(), indent=4)
+
+    def __queue_pending(self) -> bool:
+        # returns True if there is new content to write
+        if not self._autosave_pending:
+            return False
+
+        self._autosave_pending = False
+
+        content = self.__serialize()
+        if content == self._saved_content:
+            return False
+
+        self._saved_content = content
+        with self._save_lock:
+            self._pending_content = content
+
+        return True
+
+    def __save(self) -> None:
+        if self.__queue_pending():
+            utils.thread(self.__write_pending)
+
+    def __write_pending(self) -> None:
+        # The lock is held while writing, so the writes never reorder,
+        # and only the latest content is written if several saves are queued.
+        with self._save_lock:
+            content = self._pending_content
+            self._pending_content = None
+
+            if content is not None:
+                self._written_contents.append(content)
+                _write_atomic(self._file, content)  # type: ignore
+
+    def flush(self) -> None:
+        """
+        Immediately write all pending autosaved changes to the file.
+
+        Autosave is debounced and done in another thread,
+        this function is called automatically when Ignis quits.
+        """
+        # written in the calling thread, new threads can't be started at interpreter shutdown
+        self._autosave_task.cancel()
+        self.__queue_pending()
+        self.__write_pending()
 
     def save_to_file(self, file: str) -> None:
         """
@@ -381,8 +560,13 @@ class OptionsManager(OptionsGroup):
         Args:
             file: The path to the file where options will be saved.
         """
-        with open(file, "w") as fp:
-            json.dump(self.get_modified_options(), fp, indent=4)
+        content = self.__serialize()
+
+        if file == self._file:
+            self._saved_content = content
+            self._written_contents.append(content)
+
+        _write_atomic(file, content)
 
     def load_from_file(self, file: str, emit: bool = True) -> None:
         """
@@ -393,5 +577,9 @@ class OptionsManager(OptionsGroup):
             emit: Whether to emit the :attr:`changed `and :attr:`subgroup_changed` signals for options in `file` that differ from those on `self`.
         """
         with open(file) as fp:
-            data = json.load(fp)
-            self.apply_from_dict(data=data, emit=emit, autosave=False)
+            content = fp.read()
+
+        if file == self._file:
+            self._saved_content = content
+
+        self.apply_from_dict(data=utils.json_loads(content), emit=emit, autosave=False)
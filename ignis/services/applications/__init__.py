@@ -1,9 +1,12 @@
 from .service import ApplicationsService
 from .application import Application
 from .action import ApplicationAction
+from .constants import APPLICATIONS_CACHE_FILE, APPLICATIONS_USAGE_FILE
 
 __all__ = [
     "ApplicationsService",
     "Application",
     "ApplicationAction",
+    "APPLICATIONS_CACHE_FILE",
+    "APPLICATIONS_USAGE_FILE",
 ]
@@ -13,10 +13,20 @@ class Application(IgnisGObject):
     An application object.
     """
 
-    def __init__(self, app: Gio.DesktopAppInfo):
+    def __init__(
+        self,
+        app: Gio.DesktopAppInfo,
+        desktop_id: str | None = None,
+        desktop_file: str | None = None,
+    ):
         super().__init__()
 
-        self._app = app
+        # metadata is read from ``app``, which may be parsed from a cached copy of the desktop file
+        self._info = app
+        # the public ``app`` is loaded from disk on demand if the cached copy doesn't know its ID and path
+        self._app: Gio.DesktopAppInfo | None = app if app.get_filename() else None
+        self._id = desktop_id or app.get_id()
+        self._desktop_file = desktop_file or app.get_filename()
         self._actions: list[ApplicationAction] = []
 
         for action in app.list_actions():
@@ -34,11 +44,22 @@ class Application(IgnisGObject):
         Emitted when the application has been unpinned.
         """
 
+    @IgnisSignal
+    def launched(self):
+        """
+        Emitted when the application has been launched.
+        """
+
     @IgnisProperty
     def app(self) -> Gio.DesktopAppInfo:
         """
         An instance of :class:`Gio.DesktopAppInfo`.
+
+        Applications restored from the desktop entry cache load their desktop file on the first access,
+        so ``get_id()`` and ``get_filename()`` of the returned object work as usual.
         """
+        if self._app is None:
+            self._app = self.__load_app_info()
         return self._app
 
     @IgnisProperty
@@ -46,28 +67,35 @@ class Application(IgnisGObject):
         """
         The ID of the application.
         """
-        return self._app.get_id()
+        return self._id
 
     @IgnisProperty
     def name(self) -> str:
         """
         The name of the application.
         """
-        return self._app.get_display_name()
+        return self._info.get_display_name()
 
     @IgnisProperty
     def description(self) -> str | None:
         """
         The description of the application.
         """
-        return self._app.get_description()
+        return self._info.get_description()
+
+    @IgnisProperty
+    def generic_name(self) -> str | None:
+        """
+        The generic name of the application, e.g., "Web Browser".
+        """
+        return self._info.get_generic_name()
 
     @IgnisProperty
     def icon(self) -> str:
         """
         The icon of the application. If the app has no icon, "image-missing" will be returned.
         """
-        icon = self._app.get_string("Icon")
+        icon = self._info.get_string("Icon")
         if not icon:
             return "image-missing"
         else:
@@ -78,28 +106,28 @@ class Application(IgnisGObject):
         """
         Keywords of the application. Ususally, these are words that describe the application.
         """
-        return self._app.get_keywords()
+        return self._info.get_keywords()
 
     @IgnisProperty
     def desktop_file(self) -> str | None:
         """
         The full path to the ``.desktop`` file of the application.
         """
-        return self._app.get_filename()
+        return self._desktop_file
 
     @IgnisProperty
     def executable(self) -> str:
         """
         The executable of the application.
         """
-        return self._app.get_executable()
+        return self._info.get_executable()
 
     @IgnisProperty
     def exec_string(self) -> str | None:
         """
         The string that contains the executable with command line arguments, used to launch the application.
         """
-        return self._app.get_string("Exec")
+        return self._info.get_string("Exec")
 
     @IgnisProperty
     def actions(self) -> list[ApplicationAction]:
@@ -134,9 +162,19 @@ class Application(IgnisGObject):
         Whether the application has to be launched in a terminal.
         """
         return {"true": True, "false": False, None: False}.get(
-            self._app.get_string("Terminal"), False
+            self._info.get_string("Terminal"), False
         )
 
+    def __load_app_info(self) -> Gio.DesktopAppInfo:
+        # looking up by ID sets both the ID and the path
+        info = None
+        if self._id:
+            info = Gio.DesktopAppInfo.new(self._id)
+        if info is None and self._desktop_file:
+            info = Gio.DesktopAppInfo.new_from_filename(self._desktop_file)
+        # the desktop file has been removed in the meantime
+        return info or self._info
+
     def pin(self) -> None:
         """
         Pin the application.
@@ -195,6 +233,8 @@ class Application(IgnisGObject):
             )
         )
 
+        self.emit("launched")
+
     def launch_uwsm(self) -> None:
         """
         Launch the application using UWSM (Universal Wayland Session Manager).
@@ -0,0 +1,4 @@
+import ignis
+
+APPLICATIONS_CACHE_FILE = f"{ignis.CACHE_DIR}/applications/desktop_entries.json"
+APPLICATIONS_USAGE_FILE = f"{ignis.DATA_DIR}/applications/usage.json"
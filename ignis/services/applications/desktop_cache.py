@@ -0,0 +1,125 @@
+import os
+import re
+from gi.repository import GLib  # type: ignore
+from ignis import utils
+from loguru import logger
+
+_CACHE_VERSION = 1
+
+# "Key[locale]=value"
+_LOCALIZED_KEY_RE = re.compile(r"^[A-Za-z0-9-]+\[([^\]]+)\]\s*=")
+
+
+def get_desktop_dirs() -> list[str]:
+    """
+    :meta private:
+
+    Directories with desktop files, in the order of precedence.
+    """
+    return [
+        os.path.join(data_dir, "applications")
+        for data_dir in (GLib.get_user_data_dir(), *GLib.get_system_data_dirs())
+    ]
+
+
+def get_mtime(path: str | None) -> int | None:
+    """
+    :meta private:
+    """
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class DesktopEntryCache:
+    """
+    :meta private:
+
+    Stores the contents of desktop files, so applications can be created
+    without scanning all desktop directories and parsing every desktop file on the system.
+
+    The cache is valid as long as the desktop directories (and their mtimes) and the user's languages stay the same.
+    Desktop files are stored without translations to other languages to keep the cache small.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    def __get_key(self) -> dict:
+        dirs = get_desktop_dirs()
+        return {
+            "version": _CACHE_VERSION,
+            "languages": list(GLib.get_language_names()),
+            "dirs": [[d, get_mtime(d)] for d in dirs],
+        }
+
+    def load(self) -> list[dict] | None:
+        """
+        Load cached entries.
+
+        Returns:
+            A list of entries (dicts with ``id``, ``filename``, ``mtime`` and ``data`` keys),
+            or ``None`` if there is no cache or it's outdated.
+        """
+        try:
+            with open(self._path) as file:
+                cache = utils.json_loads(file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[Applications] Failed to load desktop entry cache: {e}")
+            return None
+
+        if not isinstance(cache, dict) or cache.get("key") != self.__get_key():
+            return None
+
+        return cache.get("entries")
+
+    def save(self, sources: dict[str, tuple[str, int | None]]) -> None:
+        """
+        Save entries. Reads desktop files, so should be called from a thread.
+
+        Args:
+            sources: Application ID -> (desktop file path, its mtime).
+        """
+        # computed first, so a directory changed while saving invalidates the cache
+        key = self.__get_key()
+        languages = set(key["languages"])
+        entries = []
+
+        for app_id, (filename, mtime) in sources.items():
+            try:
+                with open(filename, encoding="utf-8") as file:
+                    data = self.__strip_translations(file.read(), languages)
+            except (OSError, ValueError):
+                continue
+
+            entries.append(
+                {"id": app_id, "filename": filename, "mtime": mtime, "data": data}
+            )
+
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            tmp_file = f"{self._path}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as file:
+                file.write(utils.json_dumps({"key": key, "entries": entries}))
+            os.replace(tmp_file, self._path)
+        except OSError as e:
+            logger.warning(f"[Applications] Failed to save desktop entry cache: {e}")
+
+    def __strip_translations(self, data: str, languages: set[str]) -> str:
+        lines = []
+        for line in data.splitlines():
+            if line.startswith("#"):
+                continue
+
+            match = _LOCALIZED_KEY_RE.match(line)
+            if match and match.group(1) not in languages:
+                continue
+
+            lines.append(line)
+
+        return "\n".join(lines)
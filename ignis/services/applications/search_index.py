@@ -0,0 +1,219 @@
+import re
+import bisect
+import unicodedata
+from collections.abc import Callable, Iterable
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# How much a match in each field is worth
+FIELD_WEIGHTS = {
+    "name": 4.0,
+    "generic_name": 2.0,
+    "keywords": 2.0,
+    "exec": 1.0,
+}
+
+# How much each kind of match is worth, relative to an exact token match
+_EXACT = 1.0
+_PREFIX = 0.8
+_SUBSTRING = 0.5
+_FUZZY = 0.4
+
+# Minimal trigram similarity for a typo-tolerant match
+_MIN_SIMILARITY = 0.4
+
+
+def _fold(text: str) -> str:
+    # lowercase and strip accents, so "écran" matches "ecran"
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def tokenize(text: str | None) -> list[str]:
+    if not text:
+        return []
+    return _TOKEN_RE.findall(_fold(text))
+
+
+def _trigrams(token: str) -> set[str]:
+    padded = f" {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    :meta private:
+
+    An in-memory full-text index over application metadata.
+
+    Every field is split into tokens. A query term matches a token exactly, as a prefix,
+    as a substring or approximately (by trigram similarity, to tolerate typos).
+    Every query term must match for a document to be returned.
+    """
+
+    def __init__(self) -> None:
+        # document ID -> its display name, used to break ties
+        self._names: dict[str, str] = {}
+        # document ID -> tokens it's indexed under
+        self._doc_tokens: dict[str, set[str]] = {}
+        # token -> {document ID: weight of the best field containing it}
+        self._postings: dict[str, dict[str, float]] = {}
+        # all tokens, sorted for prefix lookups
+        self._sorted_tokens: list[str] = []
+        # trigram -> tokens containing it
+        self._trigrams: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._names
+
+    def add(self, doc_id: str, fields: dict[str, str | Iterable[str] | None]) -> None:
+        """
+        Add a document, or replace it if it's already indexed.
+
+        Args:
+            doc_id: The document ID.
+            fields: Field name (a key of ``FIELD_WEIGHTS``) -> text or a list of strings.
+        """
+        if doc_id in self._names:
+            self.remove(doc_id)
+
+        name = fields.get("name")
+        self._names[doc_id] = _fold(name) if isinstance(name, str) else ""
+
+        weights: dict[str, float] = {}
+        for field, value in fields.items():
+            weight = FIELD_WEIGHTS.get(field)
+            if weight is None or value is None:
+                continue
+
+            texts = [value] if isinstance(value, str) else value
+            for text in texts:
+                for token in tokenize(text):
+                    weights[token] = max(weights.get(token, 0.0), weight)
+
+        self._doc_tokens[doc_id] = set(weights)
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                bisect.insort(self._sorted_tokens, token)
+                for trigram in _trigrams(token):
+                    self._trigrams.setdefault(trigram, set()).add(token)
+            postings[doc_id] = weight
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Remove a document. Does nothing if it's not indexed.
+        """
+        if doc_id not in self._names:
+            return
+
+        del self._names[doc_id]
+        for token in self._doc_tokens.pop(doc_id):
+            postings = self._postings[token]
+            del postings[doc_id]
+            if postings:
+                continue
+
+            del self._postings[token]
+            del self._sorted_tokens[bisect.bisect_left(self._sorted_tokens, token)]
+            for trigram in _trigrams(token):
+                tokens = self._trigrams[trigram]
+                tokens.discard(token)
+                if not tokens:
+                    del self._trigrams[trigram]
+
+    def clear(self) -> None:
+        self.__init__()  # type: ignore
+
+    def search(
+        self, query: str, boost: Callable[[str], float] | None = None
+    ) -> list[str]:
+        """
+        Search documents.
+
+        Args:
+            query: The query.
+            boost: A function returning an additional score multiplier for a document (e.g., by launch frequency).
+                The score is multiplied by ``1 + boost(doc_id)``.
+
+        Returns:
+            Document IDs, the most relevant first.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores: dict[str, float] | None = None
+        for term in terms:
+            term_scores = self.__match_term(term)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    doc_id: score + term_scores[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in term_scores
+                }
+            if not scores:
+                return []
+
+        assert scores is not None
+
+        # the whole query being the start of the name is the strongest signal
+        folded_query = " ".join(terms)
+        for doc_id in scores:
+            if self._names[doc_id].startswith(folded_query):
+                scores[doc_id] += FIELD_WEIGHTS["name"]
+
+        if boost:
+            for doc_id in scores:
+                scores[doc_id] *= 1 + boost(doc_id)
+
+        return sorted(scores, key=lambda doc_id: (-scores[doc_id], self._names[doc_id]))
+
+    def __match_term(self, term: str) -> dict[str, float]:
+        # token -> match quality
+        matches: dict[str, float] = {}
+
+        # exact and prefix matches
+        tokens = self._sorted_tokens
+        for i in range(bisect.bisect_left(tokens, term), len(tokens)):
+            token = tokens[i]
+            if not token.startswith(term):
+                break
+            matches[token] = _EXACT if token == term else _PREFIX
+
+        if len(term) >= 3:
+            # substring and approximate matches share the trigram lookup
+            term_trigrams = _trigrams(term)
+            counts: dict[str, int] = {}
+            for trigram in term_trigrams:
+                for token in self._trigrams.get(trigram, ()):
+                    counts[token] = counts.get(token, 0) + 1
+
+            inner = len(term) - 2  # trigrams not touching the padding
+            for token, count in counts.items():
+                if token in matches:
+                    continue
+
+                if count >= inner and term in token:
+                    matches[token] = _SUBSTRING
+                    continue
+
+                # a token of N characters has N padded trigrams
+                similarity = count / (len(term_trigrams) + len(token) - count)
+                if similarity >= _MIN_SIMILARITY:
+                    matches[token] = _FUZZY * similarity
+
+        scores: dict[str, float] = {}
+        for token, quality in matches.items():
+            for doc_id, weight in self._postings[token].items():
+                score = weight * quality
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+
+        return scores
@@ -1,9 +1,23 @@
-from gi.repository import Gio  # type: ignore
+import os
+import math
+from gi.repository import Gio, GLib, Gtk  # type: ignore
+from ignis import utils
 from ignis.base_service import BaseService
+from ignis.collection import IgnisCollection
 from .application import Application
+from .search_index import SearchIndex
+from .desktop_cache import DesktopEntryCache, get_mtime
+from .usage import UsageStore
+from .constants import APPLICATIONS_CACHE_FILE, APPLICATIONS_USAGE_FILE
 from ignis.options import options
 from ignis.gobject import IgnisProperty
 
+# Package upgrades change many desktop files in a row, sync once they're done
+_SYNC_DELAY = 500
+
+# How much launch frequency affects search ranking, relative to the match quality
+_USAGE_WEIGHT = 0.3
+
 
 class ApplicationsService(BaseService):
     """
@@ -12,6 +26,12 @@ class ApplicationsService(BaseService):
 
     There are options available for this service: :class:`~ignis.options.Options.Applications`.
 
+    Launches are tracked to rank frequently used applications higher in :func:`search`
+    and to provide :attr:`frequent`.
+
+    Desktop files are cached in ``APPLICATIONS_CACHE_FILE``, so applications are available immediately on startup
+    while the list is checked for changes in the background.
+
     Example usage:
 
     .. code-block:: python
@@ -26,23 +46,58 @@ class ApplicationsService(BaseService):
 
     def __init__(self):
         super().__init__()
-        self._apps: dict[str, Application] = {}
+        self._apps: IgnisCollection[str, Application] = IgnisCollection(
+            sort_key=lambda x: x.name
+        )
+        self._search_index = SearchIndex()
+        # app ID -> (desktop file path, its mtime) the app was created from
+        self._sources: dict[str, tuple[str, int | None]] = {}
+        self._cache = DesktopEntryCache(APPLICATIONS_CACHE_FILE)
+        self._scan_id = 0
+        self._usage = UsageStore(APPLICATIONS_USAGE_FILE)
 
+        self._sync_task = utils.DebounceTask(_SYNC_DELAY, self.__sync_async)
         self._monitor = Gio.AppInfoMonitor.get()
-        self._monitor.connect("changed", lambda x: self.__sync())
+        self._monitor.connect("changed", lambda x: self._sync_task.run())
 
         options.applications.connect_option(
             "pinned_apps", lambda: self.notify("pinned")
         )
 
-        self.__sync()
+        if self.__load_cache():
+            # start with cached apps and check that they're up to date in the background
+            self.__sync_async()
+        else:
+            self.__apply_scan(self.__scan())
+
+        GLib.idle_add(self.__preload_icons)
 
     @IgnisProperty
     def apps(self) -> list[Application]:
         """
         A list of all installed applications.
         """
-        return sorted(self._apps.values(), key=lambda x: x.name)
+        return self._apps.items
+
+    @IgnisProperty
+    def apps_collection(self) -> IgnisCollection[str, Application]:
+        """
+        All installed applications as a collection sorted by name,
+        which reports additions and removals one by one.
+        Keys are application IDs.
+        """
+        return self._apps
+
+    @IgnisProperty
+    def frequent(self) -> list[Application]:
+        """
+        A list of launched applications, the most frequently and recently launched first.
+        """
+        return [
+            self._apps.get(app_id)  # type: ignore
+            for app_id in self._usage.get_ranked()
+            if app_id in self._apps
+        ]
 
     @IgnisProperty
     def pinned(self) -> list[Application]:
@@ -55,23 +110,143 @@ class ApplicationsService(BaseService):
             if name in self._apps
         ]
 
-    def __sync(self) -> None:
-        self._apps = {}
+    def __load_cache(self) -> bool:
+        entries = self._cache.load()
+        if entries is None:
+            return False
+
+        for entry in entries:
+            key_file = GLib.KeyFile()
+            data = entry["data"]
+            try:
+                key_file.load_from_data(
+                    data, len(data.encode()), GLib.KeyFileFlags.NONE
+                )
+            except GLib.Error:
+                continue
+
+            info = Gio.DesktopAppInfo.new_from_keyfile(key_file)
+            if info is None or info.get_nodisplay():
+                continue
 
-        for app in Gio.AppInfo.get_all():
-            if isinstance(app, Gio.DesktopAppInfo):
-                self.__add_app(app)
+            self.__add_app(
+                info,
+                (entry["filename"], entry["mtime"]),
+                desktop_id=entry["id"],
+            )
 
         self.notify("apps")
         self.notify("pinned")
+        return True
+
+    def __scan(
+        self,
+    ) -> dict[str, tuple[Gio.DesktopAppInfo, tuple[str, int | None]]]:
+        # doesn't touch the service, so it's safe to call from a thread
+        scan = {}
+        for info in Gio.AppInfo.get_all():
+            if not isinstance(info, Gio.DesktopAppInfo) or info.get_nodisplay():
+                continue
+
+            filename = info.get_filename()
+            scan[info.get_id()] = (info, (filename, get_mtime(filename)))
 
-    def __add_app(self, app: Gio.DesktopAppInfo) -> None:
-        if app.get_nodisplay():
-            return
+        return scan
 
-        obj = Application(app=app)
+    def __sync_async(self) -> None:
+        # parsing every desktop file is slow, do it in a thread
+        self._scan_id += 1
+        scan_id = self._scan_id
 
-        self._apps[obj.id] = obj
+        def on_scanned(scan) -> bool:
+            # a newer scan has been started in the meantime
+            if scan_id == self._scan_id:
+                self.__apply_scan(scan)
+            return False
+
+        utils.thread(lambda: GLib.idle_add(on_scanned, self.__scan()))
+
+    def __apply_scan(
+        self, scan: dict[str, tuple[Gio.DesktopAppInfo, tuple[str, int | None]]]
+    ) -> None:
+        changed = False
+
+        for app_id in list(self._sources):
+            if app_id not in scan:
+                self.__remove_app(app_id)
+                changed = True
+
+        for app_id, (info, source) in scan.items():
+            # unchanged desktop files keep their Application objects
+            if self._sources.get(app_id) == source and source[1] is not None:
+                continue
+
+            self.__add_app(info, source)
+            changed = True
+
+        if changed:
+            self.notify("apps")
+            self.notify("pinned")
+            utils.thread(self._cache.save, dict(self._sources))
+
+    def __add_app(
+        self,
+        app: Gio.DesktopAppInfo,
+        source: tuple[str, int | None],
+        desktop_id: str | None = None,
+    ) -> None:
+        obj = Application(app=app, desktop_id=desktop_id, desktop_file=source[0])
+
+        obj.connect("launched", self.__on_launched)
+
+        self._sources[obj.id] = source  # type: ignore
+        self._apps.set(obj.id, obj)
+        self._search_index.add(obj.id, self.__get_search_fields(obj))  # type: ignore
+
+    def __remove_app(self, app_id: str) -> None:
+        self._sources.pop(app_id, None)
+        self._apps.remove(app_id)
+        self._search_index.remove(app_id)
+
+    def __on_launched(self, app: Application) -> None:
+        self._usage.record(app.id)  # type: ignore
+        self.notify("frequent")
+
+    def __preload_icons(self) -> bool:
+        # the icon theme caches looked up icons, so launchers can show them without touching the disk
+        count = options.applications.preload_icons_count
+        if count <= 0:
+            return False
+
+        icon_theme = Gtk.IconTheme.get_for_display(utils.get_gdk_display())
+        for app in self.frequent[:count]:
+            try:
+                icon = Gio.Icon.new_for_string(app.icon)
+            except GLib.Error:
+                continue
+
+            icon_theme.lookup_by_gicon(
+                icon,
+                options.applications.preload_icons_size,
+                1,
+                Gtk.TextDirection.NONE,
+                Gtk.IconLookupFlags.PRELOAD,
+            )
+
+        return False
+
+    @staticmethod
+    def __get_search_fields(app: Application) -> dict:
+        desktop_id = app.id or ""
+        return {
+            "name": app.name,
+            "generic_name": app.generic_name,
+            "keywords": app.keywords,
+            "exec": [
+                os.path.basename(app.executable or ""),
+                desktop_id.removesuffix(".desktop"),
+            ],
+        }
 
     @classmethod
     def search(
@@ -82,16 +257,36 @@ class ApplicationsService(BaseService):
         """
         Search applications by a query.
 
+        Applications are matched by name, generic name (e.g., "Web Browser"), keywords and executable,
+        tolerating typos. The search runs on an index that is kept up to date as applications change,
+        so it's cheap enough to be called on every keystroke.
+
         Args:
             apps: A list of applications where to search, e.g., :attr:`~ignis.services.applications.ApplicationsService.apps`.
             query: The string to be searched for.
 
         Returns:
-            list[Application]: A list of applications filtered by the provided query.
+            list[Application]: A list of applications filtered by the provided query,
+            the most relevant (and frequently launched) first.
         """
+        by_id = {app.id: app for app in apps}
+        if not by_id:
+            return []
+
+        service = cls.get_default()
+        index = service._search_index
+        if any(app is not service._apps.get(app_id) for app_id, app in by_id.items()):
+            # some apps aren't provided by the service (e.g., created manually),
+            # index the given ones separately
+            index = SearchIndex()
+            for app in by_id.values():
+                index.add(app.id, cls.__get_search_fields(app))  # type: ignore
+
+        def boost(app_id: str) -> float:
+            return _USAGE_WEIGHT * math.log1p(service._usage.get_score(app_id))
+
         return [
-            entry
-            for result in Gio.DesktopAppInfo.search(query)
-            for entry in apps
-            if entry.id in result
+            by_id[app_id]
+            for app_id in index.search(query, boost=boost)
+            if app_id in by_id
         ]
@@ -0,0 +1,98 @@
+import os
+import time
+from ignis import utils
+from loguru import logger
+
+# A launch is worth half as much after this time
+_HALF_LIFE = 7 * 24 * 60 * 60
+
+# Only the most used apps are stored
+_MAX_ENTRIES = 256
+
+
+class UsageStore:
+    """
+    :meta private:
+
+    Tracks how often and how recently applications are launched ("frecency").
+
+    Every app has a score that grows by one on every launch and halves every week.
+    Only the score and the time of the last launch are stored.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        # app ID -> (score at the time of the last launch, time of the last launch)
+        self._entries: dict[str, tuple[float, float]] = {}
+        self.__load()
+
+    def __load(self) -> None:
+        try:
+            with open(self._path) as file:
+                data = utils.json_loads(file.read())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"[Applications] Failed to load usage data: {e}")
+            return
+
+        for app_id, entry in data.get("apps", {}).items():
+            try:
+                score, last_used = entry
+                self._entries[app_id] = (float(score), float(last_used))
+            except (TypeError, ValueError):
+                continue
+
+    def __save(self) -> None:
+        now = time.time()
+        ranked = sorted(self._entries, key=lambda x: -self.get_score(x, now))
+        self._entries = {
+            app_id: self._entries[app_id] for app_id in ranked[:_MAX_ENTRIES]
+        }
+
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            tmp_file = f"{self._path}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as file:
+                file.write(
+                    utils.json_dumps(
+                        {
+                            "apps": {
+                                app_id: [round(score, 4), round(last_used)]
+                                for app_id, (score, last_used) in self._entries.items()
+                            }
+                        }
+                    )
+                )
+            os.replace(tmp_file, self._path)
+        except OSError as e:
+            logger.warning(f"[Applications] Failed to save usage data: {e}")
+
+    def record(self, app_id: str) -> None:
+        """
+        Record a launch of an application.
+        """
+        now = time.time()
+        self._entries[app_id] = (self.get_score(app_id, now) + 1, now)
+        self.__save()
+
+    def get_score(self, app_id: str, now: float | None = None) -> float:
+        """
+        Get the current score of an application, ``0`` if it has never been launched.
+        """
+        entry = self._entries.get(app_id)
+        if entry is None:
+            return 0.0
+
+        score, last_used = entry
+        if now is None:
+            now = time.time()
+
+        return score * 0.5 ** (max(now - last_used, 0) / _HALF_LIFE)
+
+    def get_ranked(self) -> list[str]:
+        """
+        Get IDs of all launched applications, the most used first.
+        """
+        now = time.time()
+        return sorted(self._entries, key=lambda x: -self.get_score(x, now))
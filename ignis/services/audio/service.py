@@ -1,4 +1,5 @@
 from ignis.base_service import BaseService
+from ignis.collection import IgnisCollection
 from ignis.gobject import IgnisProperty, IgnisSignal
 from ._imports import Gvc
 from .stream import Stream, DefaultStream
@@ -35,10 +36,10 @@ class AudioService(BaseService):
 
         self._streams: dict[int, Stream] = {}
 
-        self._speakers: dict[int, Stream] = {}
-        self._microphones: dict[int, Stream] = {}
-        self._apps: dict[int, Stream] = {}
-        self._recorders: dict[int, Stream] = {}
+        self._speakers: IgnisCollection[int, Stream] = IgnisCollection()
+        self._microphones: IgnisCollection[int, Stream] = IgnisCollection()
+        self._apps: IgnisCollection[int, Stream] = IgnisCollection()
+        self._recorders: IgnisCollection[int, Stream] = IgnisCollection()
 
         self._control.connect("default-sink-changed", self.__default_changed, "speaker")
         self._control.connect(
@@ -131,35 +132,67 @@ class AudioService(BaseService):
         """
         A list of speakers.
         """
-        return list(self._speakers.values())
+        return self._speakers.items
 
     @IgnisProperty
     def microphones(self) -> list[Stream]:
         """
         A list of microphones.
         """
-        return list(self._microphones.values())
+        return self._microphones.items
 
     @IgnisProperty
     def apps(self) -> list[Stream]:
         """
         A list of applications currently playing sound.
         """
-        return list(self._apps.values())
+        return self._apps.items
 
     @IgnisProperty
     def recorders(self) -> list[Stream]:
         """
         A list of audio recorders.
         """
-        return list(self._recorders.values())
+        return self._recorders.items
+
+    @IgnisProperty
+    def speakers_collection(self) -> IgnisCollection[int, Stream]:
+        """
+        Speakers as a collection, which reports additions and removals one by one.
+        Keys are stream IDs.
+        """
+        return self._speakers
+
+    @IgnisProperty
+    def microphones_collection(self) -> IgnisCollection[int, Stream]:
+        """
+        Microphones as a collection, which reports additions and removals one by one.
+        Keys are stream IDs.
+        """
+        return self._microphones
+
+    @IgnisProperty
+    def apps_collection(self) -> IgnisCollection[int, Stream]:
+        """
+        Applications currently playing sound as a collection, which reports additions and removals one by one.
+        Keys are stream IDs.
+        """
+        return self._apps
+
+    @IgnisProperty
+    def recorders_collection(self) -> IgnisCollection[int, Stream]:
+        """
+        Audio recorders as a collection, which reports additions and removals one by one.
+        Keys are stream IDs.
+        """
+        return self._recorders
 
     def __add_stream(self, control: Gvc.MixerControl, id: int):
         stream = control.lookup_stream_id(id)
         audio_stream = Stream(stream=stream, control=control)
         stream_type = self.__get_stream_type(stream)
         if stream_type:
-            getattr(self, f"_{stream_type}s")[id] = audio_stream
+            getattr(self, f"_{stream_type}s").set(id, audio_stream)
             self._streams[id] = audio_stream
             self.emit(f"{stream_type}-added", audio_stream)
             self.notify(f"{stream_type}s")
@@ -168,7 +201,7 @@ class AudioService(BaseService):
         audio_stream = self._streams.pop(id)
         stream_type = self.__get_stream_type(audio_stream.stream)
         if stream_type:
-            getattr(self, f"_{stream_type}s").pop(id)
+            getattr(self, f"_{stream_type}s").remove(id)
             audio_stream._remove()
             self.notify(f"{stream_type}s")
 
@@ -1,5 +1,6 @@
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty, IgnisSignal
+from ignis.collection import IgnisCollection
 from ._imports import GnomeBluetooth
 from .device import BluetoothDevice
 from .constants import ADAPTER_STATE
@@ -15,7 +16,10 @@ class BluetoothService(BaseService):
         super().__init__()
 
         self._client = GnomeBluetooth.Client.new()
-        self._devices: dict[str, BluetoothDevice] = {}
+        self._devices: IgnisCollection[str, BluetoothDevice] = IgnisCollection()
+        self._connected_devices: IgnisCollection[str, BluetoothDevice] = (
+            IgnisCollection()
+        )
 
         self._client.connect("device-added", self.__add_device)
         self._client.connect("device-removed", self.__remove_device)
@@ -53,14 +57,30 @@ class BluetoothService(BaseService):
         """
         A list of all Bluetooth devices.
         """
-        return list(self._devices.values())
+        return self._devices.items
 
     @IgnisProperty
     def connected_devices(self) -> list[BluetoothDevice]:
         """
         A list of currently connected Bluetooth devices.
         """
-        return [i for i in self._devices.values() if i.connected]
+        return self._connected_devices.items
+
+    @IgnisProperty
+    def devices_collection(self) -> IgnisCollection[str, BluetoothDevice]:
+        """
+        All Bluetooth devices as a collection, which reports additions and removals one by one.
+        Keys are D-Bus object paths of devices.
+        """
+        return self._devices
+
+    @IgnisProperty
+    def connected_devices_collection(self) -> IgnisCollection[str, BluetoothDevice]:
+        """
+        Currently connected Bluetooth devices as a collection, which reports additions and removals one by one.
+        Keys are D-Bus object paths of devices.
+        """
+        return self._connected_devices
 
     @IgnisProperty
     def powered(self) -> bool:
@@ -102,18 +122,29 @@ class BluetoothService(BaseService):
 
     def __add_device(self, x, gdevice: GnomeBluetooth.Device) -> None:
         device = BluetoothDevice(self._client, gdevice)
-        self._devices[gdevice.get_object_path()] = device
+        object_path = gdevice.get_object_path()
+        self._devices.set(object_path, device)
         self.emit("device-added", device)
         device.connect(
-            "notify::connected", lambda x, y: self.notify("connected-devices")
+            "notify::connected",
+            lambda x, y: self.__sync_connected(object_path, device),
         )
+        self.__sync_connected(object_path, device)
         self.notify("devices")
 
+    def __sync_connected(self, object_path: str, device: BluetoothDevice) -> None:
+        if device.connected and self._devices.get(object_path) is device:
+            self._connected_devices.set(object_path, device)
+        else:
+            self._connected_devices.remove(object_path)
+        self.notify("connected-devices")
+
     def __remove_device(self, x, object_path: str) -> None:
         if object_path not in self._devices:
             return
 
-        device = self._devices.pop(object_path)
-        device.emit("removed")
+        device = self._devices.remove(object_path)
+        self._connected_devices.remove(object_path)
+        device.emit("removed")  # type: ignore
         self.notify("connected-devices")
         self.notify("devices")
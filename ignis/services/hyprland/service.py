@@ -1,4 +1,3 @@
-import json
 import os
 import socket
 from typing import Any, Literal
@@ -258,7 +257,7 @@ class HyprlandService(BaseService):
     def __initial_sync_obj_list(self, type_: _SupportedTypes) -> None:
         obj_desc = self._OBJ_TYPES[type_]
 
-        data_list = json.loads(self.send_command(obj_desc.cmd))
+        data_list = utils.json_loads(self.send_command(obj_desc.cmd))
 
         for data in data_list:
             obj = obj_desc.cr_func()
@@ -273,7 +272,7 @@ class HyprlandService(BaseService):
     def __get_obj_data(self, type_: _SupportedTypes, key: Any) -> dict:
         obj_desc = self._OBJ_TYPES[type_]
 
-        for data in json.loads(self.send_command(obj_desc.cmd)):
+        for data in utils.json_loads(self.send_command(obj_desc.cmd)):
             if obj_desc.get_key_func(data) == key:
                 return data
 
@@ -341,12 +340,12 @@ class HyprlandService(BaseService):
         self._workspaces = dict(sorted(self._workspaces.items()))
 
     def __sync_active_workspace(self) -> None:
-        workspace_data = json.loads(self.send_command("j/activeworkspace"))
+        workspace_data = utils.json_loads(self.send_command("j/activeworkspace"))
         self._active_workspace.sync(workspace_data)
         self.notify("active-workspace")
 
     def __sync_main_keyboard(self) -> None:
-        data_list = json.loads(self.send_command("j/devices"))["keyboards"]
+        data_list = utils.json_loads(self.send_command("j/devices"))["keyboards"]
 
         for kb_data in data_list:
             if kb_data["main"] is True:
@@ -358,7 +357,7 @@ class HyprlandService(BaseService):
         self._main_keyboard.sync({"active_keymap": layout})
 
     def __sync_active_window(self) -> None:
-        active_window_data = json.loads(self.send_command("j/activewindow"))
+        active_window_data = utils.json_loads(self.send_command("j/activewindow"))
         if active_window_data == {}:
             active_window_data = HyprlandWindow().data
 
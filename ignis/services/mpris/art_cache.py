@@ -0,0 +1,226 @@
+import os
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from gi.repository import GLib, Gdk, GdkPixbuf  # type: ignore
+from loguru import logger
+from ignis import utils
+from ignis.options import options
+from .constants import ART_URL_CACHE_DIR
+
+# Limits for fetching art, players often point to remote images
+_MAX_CONCURRENT_FETCHES = 4
+_FETCH_TIMEOUT = 10
+
+# The number of decoded textures kept in memory
+_TEXTURE_CACHE_SIZE = 8
+
+_INDEX_FILE = "index.json"
+
+
+class ArtCache:
+    """
+    :meta private:
+
+    A disk cache of track art shared between all players.
+
+    Images are downscaled to ``options.mpris.art_max_size`` and stored by content hash,
+    so the same cover used by many tracks (or URLs) is stored once.
+    When the cache exceeds ``options.mpris.art_cache_max_size``, the least recently used images are removed.
+    Concurrent requests for the same URL share a single fetch.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        # URL -> cached file name
+        self._index: dict[str, str] = {}
+        self._pending: dict[str, asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+        self._textures: OrderedDict[str, Gdk.Texture] = OrderedDict()
+        self._save_index_task = utils.DebounceTask(1000, self.__save_index)
+
+        os.makedirs(path, exist_ok=True)
+        self.__load_index()
+
+    def __load_index(self) -> None:
+        try:
+            with open(os.path.join(self._path, _INDEX_FILE)) as file:
+                self._index = utils.json_loads(file.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"[MPRIS] Failed to load art cache index: {e}")
+
+    def __save_index(self) -> None:
+        # drop URLs of evicted images
+        self._index = {
+            url: filename
+            for url, filename in self._index.items()
+            if os.path.exists(os.path.join(self._path, filename))
+        }
+
+        path = os.path.join(self._path, _INDEX_FILE)
+        try:
+            tmp_file = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_file, "w") as file:
+                file.write(utils.json_dumps(self._index))
+            os.replace(tmp_file, path)
+        except OSError as e:
+            logger.warning(f"[MPRIS] Failed to save art cache index: {e}")
+
+    async def get_async(self, url: str) -> str | None:
+        """
+        Get the path to the cached art, fetching it if needed.
+
+        Args:
+            url: The URL of the art (``file://``, ``http://`` or ``https://``).
+
+        Returns:
+            The path to the cached image, or ``None`` if it can't be fetched or decoded.
+        """
+        filename = self._index.get(url)
+        if filename is not None:
+            cached_path = os.path.join(self._path, filename)
+            try:
+                # mark as recently used
+                os.utime(cached_path)
+                return cached_path
+            except OSError:
+                del self._index[url]
+
+        pending = self._pending.get(url)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[url] = future
+        result: str | None = None
+        try:
+            result = await self.__fetch(url)
+        finally:
+            del self._pending[url]
+            # waiters must not hang even if the fetch is cancelled
+            future.set_result(result)
+
+        if result is not None:
+            self._index[url] = os.path.basename(result)
+            self._save_index_task.run()
+
+        return result
+
+    async def __fetch(self, url: str) -> str | None:
+        async with self._semaphore:
+            try:
+                contents = await asyncio.wait_for(
+                    utils.read_file_async(uri=url, decode=False), _FETCH_TIMEOUT
+                )
+            except (GLib.Error, TimeoutError, ValueError) as e:
+                logger.warning(f"[MPRIS] Failed to fetch art {url}: {e}")
+                return None
+
+        return await asyncio.to_thread(
+            self.__store,
+            contents,
+            options.mpris.art_max_size,
+            options.mpris.art_cache_max_size * 1024 * 1024,
+        )
+
+    def __store(self, contents: bytes, max_size: int, budget: int) -> str | None:
+        # the size is part of the name, so changing it doesn't reuse larger images
+        digest = hashlib.blake2b(contents, digest_size=16).hexdigest()
+        path = os.path.join(self._path, f"{digest}-{max_size}.png")
+
+        if os.path.exists(path):
+            os.utime(path)
+            return path
+
+        try:
+            loader = GdkPixbuf.PixbufLoader()
+            loader.write(contents)
+            loader.close()
+            pixbuf = loader.get_pixbuf()
+
+            width, height = pixbuf.get_width(), pixbuf.get_height()
+            if max_size > 0 and max(width, height) > max_size:
+                scale = max_size / max(width, height)
+                pixbuf = pixbuf.scale_simple(
+                    max(1, round(width * scale)),
+                    max(1, round(height * scale)),
+                    GdkPixbuf.InterpType.BILINEAR,
+                )
+
+            # rename, so a half-written file is never used
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            pixbuf.savev(tmp_path, "png")
+            os.replace(tmp_path, path)
+        except (GLib.Error, OSError) as e:
+            logger.warning(f"[MPRIS] Failed to save art: {e}")
+            return None
+
+        self.__evict(budget, keep=path)
+        return path
+
+    def __evict(self, budget: int, keep: str) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self._path) as it:
+            for entry in it:
+                # files of older Ignis versions are counted too, so they are removed first
+                if entry.name == _INDEX_FILE or entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        # the least recently used first
+        entries.sort()
+        for _, size, path in entries:
+            if total <= budget:
+                break
+            if path == keep:
+                continue
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def get_texture(self, path: str) -> "Gdk.Texture | None":
+        """
+        Get a decoded texture of a cached image.
+        The most recently used textures are kept in memory.
+        """
+        texture = self._textures.get(path)
+        if texture is not None:
+            self._textures.move_to_end(path)
+            return texture
+
+        try:
+            texture = Gdk.Texture.new_from_filename(path)
+        except GLib.Error as e:
+            logger.warning(f"[MPRIS] Failed to load art {path}: {e}")
+            return None
+
+        self._textures[path] = texture
+        if len(self._textures) > _TEXTURE_CACHE_SIZE:
+            self._textures.popitem(last=False)
+
+        return texture
+
+
+_art_cache: ArtCache | None = None
+
+
+def get_art_cache() -> ArtCache:
+    """
+    :meta private:
+    """
+    global _art_cache
+    if _art_cache is None:
+        _art_cache = ArtCache(ART_URL_CACHE_DIR)
+    return _art_cache
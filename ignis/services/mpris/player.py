@@ -1,13 +1,11 @@
-import os
 import asyncio
 from ignis.dbus import DBusProxy
-from gi.repository import GLib  # type: ignore
+from gi.repository import GLib, Gdk  # type: ignore
 from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
 from ignis import utils
 from ignis.connection_manager import ConnectionManager
 from collections.abc import Callable
-from .constants import ART_URL_CACHE_DIR
-from .util import uri_to_unix_path
+from .art_cache import get_art_cache
 
 
 class MprisPlayer(IgnisGObject):
@@ -32,6 +30,7 @@ class MprisPlayer(IgnisGObject):
         self._metadata: dict = {}
         self._playback_status: str | None = None
         self._position: int = -1
+        self._rate: float = 1.0
         self._shuffle: bool = False
         self._volume: int = -1
         self._identity: str | None = None
@@ -41,6 +40,7 @@ class MprisPlayer(IgnisGObject):
         self._track_id: str | None = None
         self._length: int = -1
         self._art_url: str | None = None
+        self._art_texture: Gdk.Texture | None = None
         self._album: str | None = None
         self._artist: str | None = None
         self._title: str | None = None
@@ -48,7 +48,11 @@ class MprisPlayer(IgnisGObject):
 
         self._previous_art_url: str | None = None
 
-        os.makedirs(ART_URL_CACHE_DIR, exist_ok=True)
+        # the position is extrapolated locally from the last position reported by the player
+        # (in microseconds) and the monotonic time it was received at
+        self._position_anchor: int = -1
+        self._position_anchor_time: int = 0
+        self._position_timeout: utils.Timeout | None = None
 
         self.__mpris_proxy.watch_name(on_name_vanished=lambda *_: self.__close())
 
@@ -62,6 +66,10 @@ class MprisPlayer(IgnisGObject):
             "notify::metadata",
             lambda *_: asyncio.create_task(self.__sync_metadata()),
         )
+        self._seeked_id = self.__player_proxy.signal_subscribe(
+            signal_name="Seeked",
+            callback=lambda *args: self.__set_position_anchor(args[5][0]),
+        )
 
     @classmethod
     async def new_async(cls, name: str) -> "MprisPlayer":
@@ -84,7 +92,6 @@ class MprisPlayer(IgnisGObject):
         return obj
 
     async def _initial_sync(self) -> None:
-        self._sync_pos_task = asyncio.create_task(self.__sync_position())
         await self.__sync_all()
         await self.__sync_metadata()
         await self.__update_position()
@@ -92,7 +99,9 @@ class MprisPlayer(IgnisGObject):
     def __close(self) -> None:
         self.__mpris_proxy.unwatch_name()
         self._conn_mgr.disconnect_all()
-        self._sync_pos_task.cancel()
+        self.__player_proxy.signal_unsubscribe(self._seeked_id)
+        if self._position_timeout:
+            self._position_timeout.cancel()
         self.emit("closed")
 
     async def __sync_property(self, proxy: DBusProxy, py_name: str) -> None:
@@ -108,6 +117,8 @@ class MprisPlayer(IgnisGObject):
         self.notify(py_name.replace("_", "-"))
 
     async def __sync_all(self) -> None:
+        old_state = (self._playback_status, self._rate, self._metadata)
+
         for prop_name in (
             "can_control",
             "can_go_next",
@@ -118,11 +129,16 @@ class MprisPlayer(IgnisGObject):
             "loop_status",
             "metadata",
             "playback_status",
+            "rate",
             "shuffle",
             "volume",
         ):
             await self.__sync_property(self.__player_proxy, prop_name)
 
+        # players don't report position changes, resync it only when the extrapolation becomes invalid
+        if (self._playback_status, self._rate, self._metadata) != old_state:
+            await self.__update_position()
+
         for prop_name in (
             "identity",
             "desktop_entry",
@@ -169,34 +185,64 @@ class MprisPlayer(IgnisGObject):
         self._previous_art_url = art_url
 
         if art_url:
-            result = await self.__load_art_url(art_url)
+            result = await get_art_cache().get_async(art_url)
+
+        # the track has changed while the art was being fetched
+        if art_url != self._previous_art_url:
+            return
 
         self._art_url = result
+        self._art_texture = get_art_cache().get_texture(result) if result else None
         self.notify("art_url")
-
-    async def __load_art_url(self, art_url: str) -> str:
-        path = ART_URL_CACHE_DIR + "/" + uri_to_unix_path(art_url)
-        if os.path.exists(path):
-            return path
-
-        contents = await utils.read_file_async(uri=art_url, decode=False)
-        await utils.write_file_async(path=path, contents=contents)
-        return path
+        self.notify("art_texture")
 
     async def __update_position(self) -> None:
         try:
             position = await self.__player_proxy.get_dbus_property_async("Position")
         except GLib.Error:
             return
-        if position:
-            self._position = position // 1_000_000
+        if position is not None:
+            self.__set_position_anchor(position)
+
+    def __set_position_anchor(self, position: int) -> None:
+        self._position_anchor = position
+        self._position_anchor_time = GLib.get_monotonic_time()
+        self.notify("position-precise")
+        self.__update_position_tick()
+
+    def __get_position_us(self) -> int:
+        if self._position_anchor < 0:
+            return -1
+
+        position = self._position_anchor
+        if self._playback_status == "Playing":
+            elapsed = GLib.get_monotonic_time() - self._position_anchor_time
+            position += int(elapsed * self._rate)
+
+        length = self._metadata.get("mpris:length")
+        if length:
+            position = min(position, length)
+
+        return position
+
+    def __update_position_tick(self) -> None:
+        # notify "position" every whole second, using local time instead of polling the player
+        if self._position_timeout:
+            self._position_timeout.cancel()
+            self._position_timeout = None
+
+        position = self.__get_position_us()
+        if position // 1_000_000 != self._position:
+            self._position = position // 1_000_000 if position >= 0 else -1
             self.notify("position")
 
-    async def __sync_position(self) -> None:
-        while True:
-            if self.playback_status != "Paused":
-                await self.__update_position()
-            await asyncio.sleep(1)
+        if position < 0 or self._playback_status != "Playing" or self._rate <= 0:
+            return
+
+        until_next_second = (1_000_000 - position % 1_000_000) / self._rate
+        self._position_timeout = utils.Timeout(
+            int(until_next_second // 1000) + 1, self.__update_position_tick
+        )
 
     @IgnisSignal
     def ready(self): ...  # user shouldn't connect to this signal
@@ -282,9 +328,20 @@ class MprisPlayer(IgnisGObject):
     def art_url(self) -> str | None:
         """
         The path to the cached art image of the track.
+
+        Images are downscaled to :attr:`~ignis.options.Options.Mpris.art_max_size`.
         """
         return self._art_url
 
+    @IgnisProperty
+    def art_texture(self) -> "Gdk.Texture | None":
+        """
+        The decoded art image of the track.
+
+        Recently used images are kept in memory, so tracks of the same album don't decode the image again.
+        """
+        return self._art_texture
+
     @IgnisProperty
     def album(self) -> str | None:
         """
@@ -324,6 +381,9 @@ class MprisPlayer(IgnisGObject):
     def position(self) -> int:
         """
         The current position in the track in seconds.
+
+        It's computed locally from the last position reported by the player and
+        notified every second during playback, without querying the player.
         """
         return self._position
 
@@ -344,6 +404,26 @@ class MprisPlayer(IgnisGObject):
         )
         await self.__update_position()
 
+    @IgnisProperty
+    def position_precise(self) -> float:
+        """
+        The current position in the track in seconds, with sub-second precision,
+        ``-1`` if not supported by the player.
+
+        It's computed on every read, so it can be read on every frame (e.g., with :func:`Gtk.Widget.add_tick_callback`)
+        to animate a progress bar smoothly, without any D-Bus calls.
+        It's notified only when the player reports a new position (e.g., after seeking).
+        """
+        position = self.__get_position_us()
+        return position / 1_000_000 if position >= 0 else -1
+
+    @IgnisProperty
+    def rate(self) -> float:
+        """
+        The current playback rate.
+        """
+        return self._rate
+
     @IgnisProperty
     def shuffle(self) -> bool:
         """
@@ -3,6 +3,7 @@ from ignis.dbus import DBusProxy
 from ignis import utils
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty, IgnisSignal
+from ignis.collection import IgnisCollection
 from .player import MprisPlayer
 
 
@@ -23,7 +24,7 @@ class MprisService(BaseService):
 
     def __init__(self):
         super().__init__()
-        self._players: dict[str, MprisPlayer] = {}
+        self._players: IgnisCollection[str, MprisPlayer] = IgnisCollection()
 
         self.__dbus = DBusProxy.new(
             name="org.freedesktop.DBus",
@@ -52,14 +53,14 @@ class MprisService(BaseService):
         ):
             player = await MprisPlayer.new_async(name)
 
-            self._players[name] = player
+            self._players.set(name, player)
             player.connect("closed", lambda x: self.__remove_player(name))
             self.emit("player_added", player)
             self.notify("players")
 
     def __remove_player(self, name: str) -> None:
         if name in self._players:
-            self._players.pop(name)
+            self._players.remove(name)
             self.notify("players")
 
     @IgnisSignal
@@ -77,4 +78,12 @@ class MprisService(BaseService):
         """
         A list of currently active players.
         """
-        return list(self._players.values())
+        return self._players.items
+
+    @IgnisProperty
+    def players_collection(self) -> IgnisCollection[str, MprisPlayer]:
+        """
+        Currently active players as a collection, which reports additions and removals one by one.
+        Keys are D-Bus bus names of players.
+        """
+        return self._players
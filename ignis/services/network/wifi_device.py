@@ -1,4 +1,5 @@
 from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
+from ignis.collection import IgnisCollection
 from ._imports import NM
 from .access_point import WifiAccessPoint, ActiveAccessPoint
 from .constants import STATE
@@ -13,7 +14,9 @@ class WifiDevice(IgnisGObject):
         super().__init__()
         self._device = device
         self._client = client
-        self._access_points: dict[str, WifiAccessPoint] = {}  # bssid: WifiAccessPoint
+        self._access_points: IgnisCollection[str, WifiAccessPoint] = (
+            IgnisCollection()
+        )  # bssid: WifiAccessPoint
 
         self._client.connect(
             "notify::wireless-enabled", lambda *args: self.notify_all()
@@ -52,7 +55,15 @@ class WifiDevice(IgnisGObject):
         """
         A list of access points (Wi-FI networks).
         """
-        return list(self._access_points.values())
+        return self._access_points.items
+
+    @IgnisProperty
+    def access_points_collection(self) -> IgnisCollection[str, WifiAccessPoint]:
+        """
+        Access points as a collection (and a ``Gio.ListModel``), which reports additions and removals one by one.
+        Keys are BSSIDs.
+        """
+        return self._access_points
 
     @IgnisProperty
     def ap(self) -> WifiAccessPoint:
@@ -92,16 +103,14 @@ class WifiDevice(IgnisGObject):
             return
 
         obj = WifiAccessPoint(access_point, self._client, self._device)
-        self._access_points[access_point.props.bssid] = obj
+        self._access_points.set(access_point.props.bssid, obj)
 
         if emit:
             self.emit("new-access-point", obj)
             self.notify("access-points")
 
     def __remove_access_point(self, device, access_point: NM.AccessPoint) -> None:
-        try:
-            obj = self._access_points.pop(access_point.props.bssid)
+        obj = self._access_points.remove(access_point.props.bssid)
+        if obj:
             obj.emit("removed")
             self.notify("access-points")
-        except KeyError:
-            pass
@@ -0,0 +1,158 @@
+import asyncio
+import contextlib
+import json
+import socket
+import threading
+
+# Large responses (e.g. "Windows" with hundreds of windows) must fit into a single line
+_ASYNC_READ_LIMIT = 16 * 1024 * 1024
+
+
+def _encode_requests(cmds: tuple[dict | str, ...]) -> bytes:
+    return b"".join(json.dumps(cmd).encode() + b"\n" for cmd in cmds)
+
+
+class NiriConnection:
+    """
+    A long-lived connection to the Niri IPC socket for sending requests.
+
+    Niri answers requests in the order they were received, one line per request,
+    so multiple requests can be written at once (pipelined) and their replies
+    read back in order.
+    If the connection is closed by Niri, it is transparently reopened
+    and the requests that were not answered yet are sent again.
+    This is retried as long as each connection answers at least one request,
+    so an error is raised only if a fresh connection fails without answering any.
+
+    The synchronous and asynchronous interfaces use separate sockets,
+    so they never interleave replies.
+
+    Args:
+        path: The path to the Niri IPC socket.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+        self._lock = threading.Lock()
+        self._sock: socket.socket | None = None
+        self._buffer = bytearray()
+
+        self._async_lock: asyncio.Lock | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    def request(self, *cmds: dict | str) -> list[str]:
+        """
+        Send one or more requests and wait for all replies.
+
+        Args:
+            *cmds: The requests to send.
+
+        Returns:
+            A list of replies, in the same order as ``cmds``.
+        """
+        with self._lock:
+            replies: list[str] = []
+            while True:
+                reused = self._sock is not None
+                answered = len(replies)
+                try:
+                    self.__request(cmds[answered:], replies)
+                    return replies
+                except OSError:
+                    self.__close()
+                    # A stale connection or one closed partway through the batch
+                    # is worth retrying on a fresh one, as long as there is progress.
+                    if not reused and len(replies) == answered:
+                        raise
+
+    def __request(self, cmds: tuple[dict | str, ...], replies: list[str]) -> None:
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.connect(self._path)
+
+        self._sock.sendall(_encode_requests(cmds))
+
+        for _ in cmds:
+            replies.append(self.__read_line())
+
+    def __read_line(self) -> str:
+        assert self._sock is not None
+
+        start = 0
+        while True:
+            end = self._buffer.find(b"\n", start)
+            if end != -1:
+                line = self._buffer[:end].decode("utf-8", errors="ignore")
+                del self._buffer[: end + 1]
+                return line
+
+            start = len(self._buffer)
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise ConnectionResetError("Niri IPC closed the connection")
+            self._buffer += chunk
+
+    def __close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        self._buffer.clear()
+
+    async def request_async(self, *cmds: dict | str) -> list[str]:
+        """
+        Asynchronously send one or more requests and wait for all replies.
+
+        Args:
+            *cmds: The requests to send.
+
+        Returns:
+            A list of replies, in the same order as ``cmds``.
+        """
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        async with self._async_lock:
+            replies: list[str] = []
+            while True:
+                reused = self._writer is not None
+                answered = len(replies)
+                try:
+                    await self.__request_async(cmds[answered:], replies)
+                    return replies
+                except (OSError, asyncio.IncompleteReadError):
+                    self.__close_async()
+                    if not reused and len(replies) == answered:
+                        raise
+
+    async def __request_async(
+        self, cmds: tuple[dict | str, ...], replies: list[str]
+    ) -> None:
+        if self._reader is None or self._writer is None:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self._path, limit=_ASYNC_READ_LIMIT
+            )
+
+        self._writer.write(_encode_requests(cmds))
+        await self._writer.drain()
+
+        for _ in cmds:
+            line = await self._reader.readuntil(b"\n")
+            replies.append(line[:-1].decode("utf-8", errors="ignore"))
+
+    def __close_async(self) -> None:
+        if self._writer is not None:
+            # the event loop may already be closed on app shutdown
+            with contextlib.suppress(RuntimeError):
+                self._writer.close()
+        self._reader = None
+        self._writer = None
+
+    def close(self) -> None:
+        """
+        Close all open connections.
+        """
+        with self._lock:
+            self.__close()
+        self.__close_async()
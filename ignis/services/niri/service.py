@@ -1,4 +1,3 @@
-import json
 import os
 import socket
 from ignis import utils
@@ -6,6 +5,7 @@ from ignis.exceptions import NiriIPCNotFoundError
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty, IgnisSignal
 from ignis.app import IgnisApp
+from .connection import NiriConnection
 from .constants import NIRI_SOCKET
 from .keyboard import NiriKeyboardLayouts
 from .window import NiriWindow
@@ -46,9 +46,13 @@ class NiriService(BaseService):
         self._workspaces: dict[int, NiriWorkspace] = {}
         self._active_output: str = ""
         self._overview_opened = False
+        self._connection = NiriConnection(str(NIRI_SOCKET))
 
         if self.is_available:
             self.__start_event_stream()
+            IgnisApp.get_initialized().connect(
+                "shutdown", lambda *_: self._connection.close()
+            )
 
     @IgnisSignal
     def workspace_added(self, workspace: NiriWorkspace):
@@ -143,8 +147,8 @@ class NiriService(BaseService):
         #   - https://github.com/YaLTeR/niri/wiki/IPC
 
     def __listen_events(self, sock: socket.socket, break_on: str = "") -> None:
-        for event in utils.listen_socket(sock, errors="ignore"):
-            json_data = json.loads(event)
+        for event in utils.listen_socket(sock, decode=False):
+            json_data = utils.json_loads(event)
             event_type = list(json_data.keys())[0]
             event_data = list(json_data.values())[0]
 
@@ -348,6 +352,9 @@ class NiriService(BaseService):
         """
         Send a command to the Niri IPC.
 
+        The command is sent over a persistent connection,
+        which is reopened automatically if Niri closes it.
+
         Args:
             cmd: The command to send.
 
@@ -357,14 +364,49 @@ class NiriService(BaseService):
         Raises:
             NiriIPCNotFoundError: If Niri IPC is not found.
         """
-        if not self.is_available or NIRI_SOCKET is None:
+        return self.send_commands([cmd])[0]
+
+    def send_commands(self, cmds: list[dict | str]) -> list[str]:
+        """
+        Send multiple commands to the Niri IPC at once.
+
+        All commands are written in a single batch and the responses are read back in order,
+        which is much cheaper than calling :func:`send_command` for each of them.
+
+        Args:
+            cmds: The commands to send.
+
+        Returns:
+            A list of responses from Niri IPC, in the same order as ``cmds``.
+
+        Raises:
+            NiriIPCNotFoundError: If Niri IPC is not found.
+        """
+        if not self.is_available:
             raise NiriIPCNotFoundError()
 
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
-            sock.connect(NIRI_SOCKET)
-            return utils.send_socket(
-                sock, json.dumps(cmd) + "\n", errors="ignore", end_char="\n"
-            )
+        if not cmds:
+            return []
+
+        return self._connection.request(*cmds)
+
+    async def send_command_async(self, cmd: dict | str) -> str:
+        """
+        Asynchronously send a command to the Niri IPC.
+
+        Args:
+            cmd: The command to send.
+
+        Returns:
+            Response from Niri IPC.
+
+        Raises:
+            NiriIPCNotFoundError: If Niri IPC is not found.
+        """
+        if not self.is_available:
+            raise NiriIPCNotFoundError()
+
+        return (await self._connection.request_async(cmd))[0]
 
     def switch_kb_layout(self) -> None:
         """
@@ -4,6 +4,7 @@ from .service import NotificationService
 from .constants import (
     NOTIFICATIONS_CACHE_DIR,
     NOTIFICATIONS_CACHE_FILE,
+    NOTIFICATIONS_JOURNAL_FILE,
     NOTIFICATIONS_EMPTY_CACHE_FILE,
     NOTIFICATIONS_IMAGE_DATA,
 )
@@ -14,6 +15,7 @@ __all__ = [
     "NotificationService",
     "NOTIFICATIONS_CACHE_DIR",
     "NOTIFICATIONS_CACHE_FILE",
+    "NOTIFICATIONS_JOURNAL_FILE",
     "NOTIFICATIONS_EMPTY_CACHE_FILE",
     "NOTIFICATIONS_IMAGE_DATA",
 ]
@@ -23,6 +23,7 @@ class Notification(IgnisGObject):
         timeout: int,
         time: float,
         popup: bool,
+        count: int = 1,
     ):
         super().__init__()
 
@@ -36,7 +37,13 @@ class Notification(IgnisGObject):
         self._time = time
         self._urgency = urgency
         self._popup = popup
-        self._actions = [
+        self._count = count
+        self._actions = self.__create_actions(actions)
+
+        self._timeout_task = utils.Timeout(timeout, self.dismiss)
+
+    def __create_actions(self, actions: list[str]) -> list[NotificationAction]:
+        return [
             NotificationAction(
                 id=str(actions[i]),
                 label=str(actions[i + 1]),
@@ -46,8 +53,6 @@ class Notification(IgnisGObject):
             for i in range(0, len(actions), 2)
         ]
 
-        utils.Timeout(timeout, self.dismiss)
-
     @IgnisSignal
     def closed(self):
         """
@@ -137,6 +142,17 @@ class Notification(IgnisGObject):
         """
         return self._popup
 
+    @IgnisProperty
+    def count(self) -> int:
+        """
+        The number of notifications merged into this one.
+
+        Greater than ``1`` if the application sent notifications faster than allowed by
+        :attr:`~ignis.options.Options.Notifications.rate_limit`,
+        and the excess ones were merged into its latest notification.
+        """
+        return self._count
+
     @IgnisProperty
     def json(self) -> dict:
         """
@@ -152,8 +168,55 @@ class Notification(IgnisGObject):
             "timeout": self._timeout,
             "time": self._time,
             "urgency": self._urgency,
+            "count": self._count,
         }
 
+    def _update(
+        self,
+        icon: str | None,
+        summary: str,
+        body: str,
+        actions: list[str],
+        urgency: int,
+        timeout: int,
+        time: float,
+        popup: bool,
+        count: int,
+    ) -> None:
+        """
+        :meta private:
+
+        Update the notification in place (``replaces_id`` or merging).
+        """
+        values = {
+            "icon": icon,
+            "summary": summary,
+            "body": body,
+            "urgency": urgency,
+            "timeout": timeout,
+            "time": time,
+            "count": count,
+        }
+        changed = [
+            name for name, value in values.items() if getattr(self, f"_{name}") != value
+        ]
+        for name in changed:
+            setattr(self, f"_{name}", values[name])
+
+        if [j for i in self._actions for j in (i.id, i.label)] != actions:
+            self._actions = self.__create_actions(actions)
+            changed.append("actions")
+
+        self._timeout_task.cancel()
+        self._timeout_task = utils.Timeout(timeout, self.dismiss)
+
+        if popup and not self._popup:
+            self._popup = True
+            changed.append("popup")
+
+        for name in changed:
+            self.notify(name)
+
     def close(self) -> None:
         """
         Close the notification.
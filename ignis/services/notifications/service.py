@@ -1,22 +1,52 @@
 import os
-import json
+import time
+import hashlib
+import threading
+import contextlib
+from collections import Counter, defaultdict
 from ignis.dbus import DBusService, DBusProxy
 from gi.repository import GLib, GdkPixbuf  # type: ignore
 from ignis import utils
 from loguru import logger
 from datetime import datetime
+from collections.abc import Callable
 from ignis.base_service import BaseService
+from ignis.collection import IgnisCollection
+from ignis._journal import Journal
 from .notification import Notification
 from .constants import (
     NOTIFICATIONS_CACHE_DIR,
     NOTIFICATIONS_CACHE_FILE,
-    NOTIFICATIONS_EMPTY_CACHE_FILE,
+    NOTIFICATIONS_JOURNAL_FILE,
     NOTIFICATIONS_IMAGE_DATA,
 )
 from ignis.exceptions import AnotherNotificationDaemonRunningError
 from ignis.options import options
 from ignis.gobject import IgnisProperty, IgnisSignal
 
+# How often notifications older than max_history_age are evicted, in seconds
+_RETENTION_CHECK_INTERVAL = 60
+# Full (idle) rate limit buckets are dropped once there are more than this many
+_MAX_IDLE_BUCKETS = 64
+
+
+class _TokenBucket:
+    def __init__(self, burst: int) -> None:
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def refill(self, rate: float, burst: int) -> None:
+        now = time.monotonic()
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+    def take(self, rate: float, burst: int) -> bool:
+        self.refill(rate, burst)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
 
 class NotificationService(BaseService):
     """
@@ -61,13 +91,28 @@ class NotificationService(BaseService):
         self.__dbus.register_dbus_method(name="Notify", method=self.__Notify)
 
         self._id: int = 0
-        self._notifications: dict[int, Notification] = {}
-        self._popups: dict[int, Notification] = {}
+        self._notifications: IgnisCollection[int, Notification] = IgnisCollection()
+        self._popups: IgnisCollection[int, Notification] = IgnisCollection()
+        self._journal = Journal(NOTIFICATIONS_JOURNAL_FILE)
+        # saved images and the number of notifications using them
+        self._image_refs: Counter[str] = Counter()
+        # images being saved and the callbacks waiting for them
+        self._pending_images: dict[str, list[Callable[[str | None], None]]] = {}
+        # flood control
+        self._rate_buckets: dict[str, _TokenBucket] = {}
+        self._latest_ids: dict[str, int] = {}
 
         os.makedirs(NOTIFICATIONS_CACHE_DIR, exist_ok=True)
         os.makedirs(NOTIFICATIONS_IMAGE_DATA, exist_ok=True)
 
         self.__load_notifications()
+        self.__enforce_retention()
+        utils.thread(self.__collect_orphaned_images, datetime.now().timestamp())
+
+        for option in ("max_history_count", "max_history_age", "max_history_per_app"):
+            options.notifications.connect_option(option, self.__enforce_retention)
+
+        GLib.timeout_add_seconds(_RETENTION_CHECK_INTERVAL, self.__check_retention)
 
     def __on_name_lost(self, *args) -> None:
         proxy = DBusProxy.new(
@@ -108,14 +153,30 @@ class NotificationService(BaseService):
         """
         A list of all notifications.
         """
-        return list(self._notifications.values())
+        return self._notifications.items
 
     @IgnisProperty
     def popups(self) -> list[Notification]:
         """
         A list of currently active popup notifications.
         """
-        return list(self._popups.values())
+        return self._popups.items
+
+    @IgnisProperty
+    def notifications_collection(self) -> IgnisCollection[int, Notification]:
+        """
+        All notifications as a collection, which reports additions and removals one by one.
+        Keys are notification IDs.
+        """
+        return self._notifications
+
+    @IgnisProperty
+    def popups_collection(self) -> IgnisCollection[int, Notification]:
+        """
+        Currently active popup notifications as a collection, which reports additions and removals one by one.
+        Keys are notification IDs.
+        """
+        return self._popups
 
     def __GetServerInformation(self, *args) -> GLib.Variant:
         return GLib.Variant(
@@ -157,33 +218,53 @@ class NotificationService(BaseService):
         hints: dict,
         timeout: int,
     ) -> GLib.Variant:
-        def _init(_id: int) -> None:
-            self.__init_notification(
-                _id=_id,
-                app_name=app_name,
-                app_icon=app_icon,
-                summary=summary,
-                body=body,
-                actions=actions,
-                hints=hints,
-                timeout=timeout,
-            )
+        merge = False
+        if replaces_id == 0 and not self.__take_rate_token(app_name):
+            # over the rate limit, merge into the latest notification of this app
+            latest = self.get_notification(self._latest_ids.get(app_name, 0))
+            if latest:
+                replaces_id = latest.id
+                merge = True
 
         if replaces_id == 0:
             _id = self._id = self._id + 1
-            _init(_id)
-
         else:
             _id = replaces_id
-            old_notification = self.get_notification(replaces_id)
-            if old_notification:
-                old_notification.close()
-                old_notification.connect("closed", lambda x: _init(_id))
-            else:
-                _init(_id)
+
+        self.__init_notification(
+            _id=_id,
+            app_name=app_name,
+            app_icon=app_icon,
+            summary=summary,
+            body=body,
+            actions=actions,
+            hints=hints,
+            timeout=timeout,
+            merge=merge,
+        )
 
         return GLib.Variant("(u)", (_id,))
 
+    def __take_rate_token(self, app_name: str) -> bool:
+        rate = options.notifications.rate_limit
+        burst = options.notifications.rate_limit_burst
+        if rate <= 0:
+            return True
+
+        bucket = self._rate_buckets.get(app_name)
+        if bucket is None:
+            if len(self._rate_buckets) >= _MAX_IDLE_BUCKETS:
+                self.__prune_rate_buckets(rate, burst)
+            bucket = self._rate_buckets[app_name] = _TokenBucket(burst)
+
+        return bucket.take(rate, burst)
+
+    def __prune_rate_buckets(self, rate: float, burst: int) -> None:
+        for app_name, bucket in list(self._rate_buckets.items()):
+            bucket.refill(rate, burst)
+            if bucket.tokens >= burst:
+                del self._rate_buckets[app_name]
+
     def __init_notification(
         self,
         _id: int,
@@ -194,20 +275,54 @@ class NotificationService(BaseService):
         actions: list,
         hints: dict,
         timeout: int,
+        merge: bool = False,
     ) -> None:
+        def _create(icon: str | None) -> None:
+            kwargs = {
+                "icon": icon,
+                "summary": summary,
+                "body": body,
+                "actions": actions,
+                "urgency": hints.get("urgency", 1),
+                "timeout": options.notifications.popup_timeout
+                if timeout == -1
+                else timeout,
+                "time": now,
+            }
+
+            existing = self.get_notification(_id)
+            if existing:
+                self.__update_notification(existing, merge=merge, **kwargs)
+            else:
+                self.__create_notification(_id=_id, app_name=app_name, **kwargs)
+
+        now = datetime.now().timestamp()
+
         # Follow freedesktop specification
         # https://specifications.freedesktop.org/notification-spec/latest/icons-and-images.html
         if "image-data" in hints:
-            icon = self.__save_pixbuf(hints["image-data"], _id)
+            self.__save_image(hints["image-data"], _create)
         elif "image-path" in hints:
-            icon = hints["image-path"]
+            _create(hints["image-path"])
         elif app_icon != "":
-            icon = app_icon
+            _create(app_icon)
         elif "icon_data" in hints:
-            icon = self.__save_pixbuf(hints["icon_data"], _id)
+            self.__save_image(hints["icon_data"], _create)
         else:
-            icon = None
+            _create(None)
 
+    def __create_notification(
+        self,
+        _id: int,
+        app_name: str,
+        icon: str | None,
+        summary: str,
+        body: str,
+        actions: list,
+        urgency: int,
+        timeout: int,
+        time: float,
+    ) -> None:
         notification = Notification(
             dbus=self.__dbus,
             id=_id,
@@ -216,9 +331,9 @@ class NotificationService(BaseService):
             summary=summary,
             body=body,
             actions=actions,
-            urgency=hints.get("urgency", 1),
-            timeout=options.notifications.popup_timeout if timeout == -1 else timeout,
-            time=datetime.now().timestamp(),
+            urgency=urgency,
+            timeout=timeout,
+            time=time,
             popup=not options.notifications.dnd,
         )
 
@@ -227,29 +342,114 @@ class NotificationService(BaseService):
                 self.popups[0].dismiss()
 
         if notification.popup:
-            self._popups[notification.id] = notification
+            self._popups.set(notification.id, notification)
             self.emit("new_popup", notification)
             self.notify("popups")
 
         self.__add_notification(notification)
-        self.__sync()
+        self._journal.add(notification.json)
+        self._latest_ids[app_name] = notification.id
+        self.__enforce_retention()
         self.emit("notified", notification)
         self.notify("notifications")
 
-    def __save_pixbuf(self, px_args: list, notification_id: int) -> str:
-        save_path = f"{NOTIFICATIONS_IMAGE_DATA}/{notification_id}"
+    def __update_notification(
+        self,
+        notification: Notification,
+        merge: bool,
+        icon: str | None,
+        summary: str,
+        body: str,
+        actions: list,
+        urgency: int,
+        timeout: int,
+        time: float,
+    ) -> None:
+        # replaces_id: update the existing notification instead of closing and recreating it
+        old_icon = notification.icon
+        was_popup = notification.popup
+
+        notification._update(
+            icon=icon,
+            summary=summary,
+            body=body,
+            actions=actions,
+            urgency=urgency,
+            timeout=timeout,
+            time=time,
+            popup=not options.notifications.dnd,
+            count=notification.count + 1 if merge else notification.count,
+        )
+
+        if icon != old_icon:
+            self.__retain_image(icon)
+            self.__release_image(old_icon)
+
+        if notification.popup and not was_popup:
+            self._popups.set(notification.id, notification)
+            self.emit("new_popup", notification)
+            self.notify("popups")
+
+        self._journal.add(notification.json)
+
+    def __save_image(
+        self, px_args: list, callback: Callable[[str | None], None]
+    ) -> None:
+        # Images are stored by content, so an avatar sent with every message is saved once.
+        # Encoding happens in a thread, callback is called on the main loop once the file exists.
+        max_size = options.notifications.max_image_size
+        data = bytes(px_args[6])
+        digest = hashlib.blake2b(
+            repr((px_args[:6], max_size)).encode() + data, digest_size=16
+        ).hexdigest()
+        path = f"{NOTIFICATIONS_IMAGE_DATA}/{digest}.png"
+
+        if path in self._pending_images:
+            self._pending_images[path].append(callback)
+        elif path in self._image_refs or os.path.exists(path):
+            callback(path)
+        else:
+            self._pending_images[path] = [callback]
+            utils.thread(self.__encode_image, px_args, data, max_size, path)
 
-        GdkPixbuf.Pixbuf.new_from_bytes(
-            width=px_args[0],
-            height=px_args[1],
-            has_alpha=px_args[3],
-            data=GLib.Bytes.new(px_args[6]),
-            colorspace=GdkPixbuf.Colorspace.RGB,
-            rowstride=px_args[2],
-            bits_per_sample=px_args[4],
-        ).savev(save_path, "png")
+    def __encode_image(
+        self, px_args: list, data: bytes, max_size: int, path: str
+    ) -> None:
+        result: str | None = path
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
+                width=px_args[0],
+                height=px_args[1],
+                has_alpha=px_args[3],
+                data=GLib.Bytes.new(data),
+                colorspace=GdkPixbuf.Colorspace.RGB,
+                rowstride=px_args[2],
+                bits_per_sample=px_args[4],
+            )
 
-        return save_path
+            width, height = pixbuf.get_width(), pixbuf.get_height()
+            if max_size > 0 and max(width, height) > max_size:
+                scale = max_size / max(width, height)
+                pixbuf = pixbuf.scale_simple(
+                    max(1, round(width * scale)),
+                    max(1, round(height * scale)),
+                    GdkPixbuf.InterpType.BILINEAR,
+                )
+
+            # rename, so a half-written file is never used
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            pixbuf.savev(tmp_path, "png")
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to save notification image: {e}")
+            result = None
+
+        GLib.idle_add(self.__on_image_saved, path, result)
+
+    def __on_image_saved(self, path: str, result: str | None) -> bool:
+        for callback in self._pending_images.pop(path, []):
+            callback(result)
+        return False
 
     def clear_all(self) -> None:
         """
@@ -259,47 +459,146 @@ class NotificationService(BaseService):
             notify.close()
 
     def __close_notification(self, notification: Notification) -> None:
-        self._notifications.pop(notification.id)
+        # already removed (e.g., evicted), or replaced by a notification with the same ID
+        if self._notifications.get(notification.id) is not notification:
+            return
+
+        self.__remove_notification(notification)
+        self.notify("notifications")
+
+    def __remove_notification(self, notification: Notification) -> None:
+        self._notifications.remove(notification.id)
         if notification.popup:
             notification.dismiss()
-        self.__sync()
+        self._journal.remove(notification.id)
+        self.__release_image(notification.icon)
 
         self.__dbus.emit_signal(
             "NotificationClosed", GLib.Variant("(uu)", (notification.id, 2))
         )
 
+    def __enforce_retention(self, *args) -> None:
+        max_count = options.notifications.max_history_count
+        max_age = options.notifications.max_history_age
+        max_per_app = options.notifications.max_history_per_app
+
+        # oldest first, popups that are still shown are never evicted
+        candidates = [n for n in self._notifications if not n.popup]
+        evicted: dict[int, Notification] = {}
+
+        if max_age > 0:
+            min_time = datetime.now().timestamp() - max_age
+            for n in candidates:
+                if n.time < min_time:
+                    evicted[n.id] = n
+
+        if max_per_app > 0:
+            by_app: defaultdict[str, list[Notification]] = defaultdict(list)
+            for n in candidates:
+                if n.id not in evicted:
+                    by_app[n.app_name].append(n)
+
+            for app_notifications in by_app.values():
+                for n in app_notifications[:-max_per_app]:
+                    evicted[n.id] = n
+
+        if max_count > 0:
+            excess = len(self._notifications) - len(evicted) - max_count
+            for n in candidates:
+                if excess <= 0:
+                    break
+                if n.id not in evicted:
+                    evicted[n.id] = n
+                    excess -= 1
+
+        if not evicted:
+            return
+
+        for n in evicted.values():
+            self.__remove_notification(n)
+            n.close()
+
         self.notify("notifications")
 
+    def __check_retention(self) -> bool:
+        self.__enforce_retention()
+        return True
+
+    def __release_image(self, icon: str | None) -> None:
+        if icon is None or icon not in self._image_refs:
+            return
+
+        self._image_refs[icon] -= 1
+        if self._image_refs[icon] <= 0:
+            del self._image_refs[icon]
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(icon)
+
+    def __collect_orphaned_images(self, started: float) -> None:
+        # images left behind by notifications closed while Ignis wasn't running (or crashed)
+        # images saved after startup belong to new notifications
+        orphans = []
+        with os.scandir(NOTIFICATIONS_IMAGE_DATA) as entries:
+            for entry in entries:
+                with contextlib.suppress(FileNotFoundError):
+                    if entry.stat().st_mtime < started:
+                        orphans.append(entry.path)
+
+        GLib.idle_add(self.__remove_orphaned_images, orphans)
+
+    def __remove_orphaned_images(self, paths: list[str]) -> bool:
+        # runs on the main loop, like __save_image(),
+        # so an old image reused by a new notification in the meantime is already referenced
+        for path in paths:
+            if path in self._image_refs or path in self._pending_images:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+        return False
+
     def __dismiss_popup(self, notification: Notification) -> None:
-        if self._popups.get(notification.id, None):
-            self._popups.pop(notification.id)
+        if self._popups.remove(notification.id):
             self.notify("popups")
 
-    def __sync(self) -> None:
-        data = {
-            "id": self._id,
-            "notifications": [n.json for n in self.notifications],
-        }
-        with open(NOTIFICATIONS_CACHE_FILE, "w") as file:
-            json.dump(data, file, indent=2)
-
     def __add_notification(self, notification: Notification) -> None:
         notification.connect("closed", lambda x: self.__close_notification(x))
         notification.connect("dismissed", lambda x: self.__dismiss_popup(x))
-        self._notifications[notification.id] = notification
+        self._notifications.set(notification.id, notification)
+        self.__retain_image(notification.icon)
+
+    def __retain_image(self, icon: str | None) -> None:
+        if icon and os.path.dirname(icon) == NOTIFICATIONS_IMAGE_DATA:
+            self._image_refs[icon] += 1
 
     def __load_notifications(self) -> None:
-        try:
-            with open(NOTIFICATIONS_CACHE_FILE) as file:
-                log_file = json.load(file)
+        if not self._journal.exists() and os.path.exists(NOTIFICATIONS_CACHE_FILE):
+            self.__migrate_cache_file()
+        else:
+            self._journal.load()
 
-            for n in log_file.get("notifications", []):
+        for n in self._journal.records:
+            try:
                 notification = Notification(**n, popup=False, dbus=self.__dbus)
-                self.__add_notification(notification)
+            except TypeError:
+                logger.warning(f"Dropping corrupted notification from history: {n}")
+                self._journal.remove(n.get("id"))  # type: ignore
+                continue
+
+            self.__add_notification(notification)
 
-            self._id = log_file.get("id", 0)
+        self._id = self._journal.last_id
 
+    def __migrate_cache_file(self) -> None:
+        try:
+            with open(NOTIFICATIONS_CACHE_FILE, "rb") as file:
+                log_file = utils.json_loads(file.read())
+
+            self._journal.reset(
+                log_file.get("notifications", []), log_file.get("id", 0)
+            )
         except Exception:
             logger.warning("Notification history file is corrupted! Cleaning...")
-            with open(NOTIFICATIONS_CACHE_FILE, "w") as file:
-                json.dump(NOTIFICATIONS_EMPTY_CACHE_FILE, file, indent=2)
+            self._journal.reset([])
+
+        self._journal.flush()
+        os.remove(NOTIFICATIONS_CACHE_FILE)
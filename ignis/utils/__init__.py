@@ -2,12 +2,13 @@ from typing import TypeAlias
 from .debounce import DebounceTask, debounce
 from .file_monitor import FileMonitor
 from .file import read_file, read_file_async, write_file, write_file_async
+from .json_codec import json_loads, json_dumps, get_json_backend, set_json_backend
 from .icon import get_paintable, get_file_icon_name, get_app_icon_name
 from .misc import load_interface_xml, get_current_dir, get_gdk_display, open_inspector
 from .monitor import get_monitor, get_n_monitors, get_monitors
 from .pixbuf import scale_pixbuf, crop_pixbuf
 from .poll import Poll
-from .sass import sass_compile
+from .sass import sass_compile, get_sass_dependencies
 from .shell import exec_sh, exec_sh_async, AsyncCompletedProcess
 from .socket import send_socket, listen_socket
 from .str_cases import snake_to_pascal, pascal_to_snake
@@ -83,8 +84,12 @@ __all__ = [
     "get_monitor",
     "get_monitors",
     "get_n_monitors",
+    "get_sass_dependencies",
     "get_paintable",
     "get_gdk_display",
+    "get_json_backend",
+    "json_dumps",
+    "json_loads",
     "listen_socket",
     "load_interface_xml",
     "pascal_to_snake",
@@ -94,6 +99,7 @@ __all__ = [
     "sass_compile",
     "scale_pixbuf",
     "send_socket",
+    "set_json_backend",
     "snake_to_pascal",
     "thread",
     "write_file",
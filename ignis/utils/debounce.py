@@ -28,6 +28,14 @@ class DebounceTask:
             self._timeout.cancel()
         self._timeout = Timeout(self._ms, lambda: self._target(*args, **kwargs))
 
+    def cancel(self) -> None:
+        """
+        Cancel the pending call, if any.
+        """
+        if self._timeout is not None:
+            self._timeout.cancel()
+            self._timeout = None
+
 
 def debounce(ms: int):
     """
@@ -0,0 +1,113 @@
+import json
+from typing import Any, Literal
+from collections.abc import Callable
+
+JsonBackend = Literal["orjson", "msgspec", "json"]
+
+_backend: JsonBackend
+_loads: Callable[[Any], Any]
+_dumps: Callable[[Any], bytes] | None
+
+
+def _stdlib_loads(data: str | bytes | bytearray | memoryview) -> Any:
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def set_json_backend(backend: JsonBackend | None = None) -> None:
+    """
+    Set the backend used by :func:`json_loads` and :func:`json_dumps`.
+
+    By default, the fastest installed backend is used,
+    in this order: `orjson <https://github.com/ijl/orjson>`_, `msgspec <https://github.com/jcrist/msgspec>`_,
+    and the standard :mod:`json` module as a fallback.
+
+    Args:
+        backend: The name of the backend, or ``None`` to pick the fastest installed one.
+
+    Raises:
+        ImportError: If the requested backend is not installed.
+    """
+    global _backend, _loads, _dumps
+
+    candidates: tuple[JsonBackend, ...] = (
+        (backend,) if backend is not None else ("orjson", "msgspec", "json")
+    )
+
+    for name in candidates:
+        try:
+            if name == "orjson":
+                import orjson  # type: ignore
+
+                _loads = orjson.loads
+                _dumps = orjson.dumps
+            elif name == "msgspec":
+                import msgspec  # type: ignore
+
+                _loads = msgspec.json.decode
+                _dumps = msgspec.json.encode
+            else:
+                _loads = _stdlib_loads
+                _dumps = None
+        except ImportError:
+            if backend is not None:
+                raise
+            continue
+
+        _backend = name
+        return
+
+
+def get_json_backend() -> JsonBackend:
+    """
+    Get the name of the backend currently used by :func:`json_loads` and :func:`json_dumps`.
+
+    Returns:
+        The name of the backend.
+    """
+    return _backend
+
+
+def json_loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """
+    Deserialize JSON using the fastest available backend.
+
+    Unlike :func:`json.loads`, ``bytes`` are parsed directly,
+    without decoding them to ``str`` first (with the ``orjson`` and ``msgspec`` backends).
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        The deserialized Python object.
+    """
+    return _loads(data)
+
+
+def json_dumps(obj: Any, indent: int | None = None) -> str:
+    """
+    Serialize an object to JSON using the fastest available backend.
+
+    The fast backends only support compact output,
+    so the standard :mod:`json` module is used if ``indent`` is set
+    or if the object is not supported by the backend.
+
+    Args:
+        obj: The object to serialize.
+        indent: The indentation level, the same as for :func:`json.dumps`.
+
+    Returns:
+        The JSON document.
+    """
+    if _dumps is not None and indent is None:
+        try:
+            return _dumps(obj).decode()
+        except TypeError:
+            # unsupported type, let the standard library handle (or report) it
+            pass
+
+    return json.dumps(obj, indent=indent)
+
+
+set_json_backend()
@@ -1,8 +1,23 @@
+import os
+import re
 import shutil
+import hashlib
+import threading
 import subprocess
+import ignis
 from typing import Literal
+from loguru import logger
 from ignis.exceptions import SassCompilationError, SassNotFoundError
-from ignis import get_temp_dir
+
+#: The directory where compiled Sass is cached.
+SASS_CACHE_DIR = f"{ignis.CACHE_DIR}/sass"
+
+#: The maximum total size of the Sass cache in bytes, the least recently used entries are evicted first.
+SASS_CACHE_MAX_SIZE = 16 * 1024 * 1024
+
+_IMPORT_RE = re.compile(r"@(use|forward|import)\s+([^;{}\n]+)")
+_QUOTED_RE = re.compile(r"""["']([^"']+)["']""")
+_SASS_EXTENSIONS = (".scss", ".sass", ".css")
 
 # resolve Sass compiler paths and pick a default one
 # "sass" (dart-sass) is the default,
@@ -14,19 +29,452 @@ for cmd in ("sass", "grass"):
         sass_compilers[cmd] = path
 
 
-def compile_file(path: str, compiler_path: str, extra_args: list[str]) -> str:
-    compiled_css = f"{get_temp_dir()}/compiled.css"
+def _get_load_paths(extra_args: list[str]) -> list[str]:
+    load_paths = []
+    args = iter(extra_args)
+    for arg in args:
+        if arg in ("-I", "--load-path"):
+            load_paths.append(next(args, ""))
+        elif arg.startswith("--load-path="):
+            load_paths.append(arg.split("=", 1)[1])
+        elif arg.startswith("-I") and len(arg) > 2:
+            load_paths.append(arg[2:])
+    return [p for p in load_paths if p]
+
+
+def _parse_imports(contents: str) -> list[str]:
+    urls: list[str] = []
+    for match in _IMPORT_RE.finditer(contents):
+        keyword, statement = match.groups()
+        quoted = _QUOTED_RE.findall(statement)
+
+        if keyword == "import":
+            # "@import 'a', 'b'", the indented syntax also allows unquoted URLs
+            urls.extend(quoted or (url.strip() for url in statement.split(",")))
+        elif quoted:
+            # "@use 'a' as b with ($c: 'd')"
+            urls.append(quoted[0])
+    return urls
+
+
+def _get_import_candidates(url: str, base_dir: str, load_paths: list[str]) -> list[str]:
+    # all paths Sass looks for an import at, in order
+    if url.startswith(("sass:", "http://", "https://", "//", "url(")):
+        return []
+
+    candidates = []
+    for root in (base_dir, *load_paths):
+        full = os.path.abspath(os.path.join(root, url))
+        dirname, name = os.path.split(full)
+
+        if name.endswith(_SASS_EXTENSIONS):
+            candidates += [full, os.path.join(dirname, f"_{name}")]
+            continue
+
+        for ext in _SASS_EXTENSIONS:
+            candidates += [full + ext, os.path.join(dirname, f"_{name}{ext}")]
+        for ext in _SASS_EXTENSIONS:
+            candidates += [
+                os.path.join(full, f"_index{ext}"),
+                os.path.join(full, f"index{ext}"),
+            ]
+
+    return candidates
+
+
+def get_sass_dependencies(
+    path: str | None = None,
+    string: str | None = None,
+    extra_args: list[str] | None = None,
+    include_unresolved: bool = False,
+) -> list[str]:
+    """
+    Get all files a SASS/SCSS file or string (transitively) imports
+    via ``@use``, ``@forward`` and ``@import``.
+
+    Imports are resolved the same way Sass does: relative to the importing file
+    (or to the current directory for a string), then to the load paths passed in ``extra_args``
+    (``--load-path``/``-I``), also trying partials (``_name``) and ``_index`` files.
+    Built-in ``sass:`` modules and remote URLs are skipped.
+
+    Args:
+        path: The path to the SASS/SCSS file. It is included in the result.
+        string: A string with SASS/SCSS style.
+        extra_args: Additional arguments that will be passed to the Sass compiler.
+        include_unresolved: Whether to include all paths where Sass would look for imports that don't exist yet
+            (e.g., ``_new.scss`` for ``@use "new"``), so creating them can be detected.
+            Otherwise, such imports are skipped.
+
+    Returns:
+        A list of absolute paths of all dependencies.
+    """
+    load_paths = _get_load_paths(extra_args or [])
+    result: list[str] = []
+    seen: set[str] = set()
+
+    pending: list[tuple[str, str]] = []  # (contents, base directory)
+    if path is not None:
+        path = os.path.abspath(path)
+        seen.add(path)
+        result.append(path)
+        with open(path) as f:
+            pending.append((f.read(), os.path.dirname(path)))
+    elif string is not None:
+        pending.append((string, os.getcwd()))
+
+    while pending:
+        contents, base_dir = pending.pop()
+        for url in _parse_imports(contents):
+            candidates = _get_import_candidates(url, base_dir, load_paths)
+            dep = next((c for c in candidates if os.path.isfile(c)), None)
+
+            if dep is None:
+                if include_unresolved:
+                    for candidate in candidates:
+                        if candidate not in seen:
+                            seen.add(candidate)
+                            result.append(candidate)
+                continue
+
+            if dep in seen:
+                continue
+
+            seen.add(dep)
+            result.append(dep)
+            try:
+                with open(dep) as f:
+                    pending.append((f.read(), os.path.dirname(dep)))
+            except (OSError, UnicodeDecodeError):
+                continue
+
+    return result
+
+
+def _get_cache_key(
+    compiler_path: str,
+    extra_args: list[str],
+    path: str | None,
+    string: str | None,
+) -> str:
+    digest = hashlib.sha256()
+
+    digest.update(compiler_path.encode())
+    # the mtime of the compiler binary changes when it's updated
+    digest.update(str(os.stat(compiler_path).st_mtime_ns).encode())
+    digest.update("\0".join(extra_args).encode())
+
+    if string is not None:
+        digest.update(b"string\0" + string.encode())
+
+    for dep in get_sass_dependencies(path=path, string=string, extra_args=extra_args):
+        digest.update(dep.encode() + b"\0")
+        with open(dep, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+
+    return digest.hexdigest()
+
+
+def _read_cache(key: str) -> str | None:
+    cache_path = f"{SASS_CACHE_DIR}/{key}.css"
+    try:
+        with open(cache_path) as f:
+            css = f.read()
+        # mark as recently used
+        os.utime(cache_path)
+        return css
+    except OSError:
+        return None
+
+
+def _write_cache(key: str, css: str) -> None:
+    os.makedirs(SASS_CACHE_DIR, exist_ok=True)
+
+    cache_path = f"{SASS_CACHE_DIR}/{key}.css"
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(css)
+    os.replace(tmp_path, cache_path)
+
+    _evict_cache()
+
+
+def _evict_cache() -> None:
+    entries = []
+    total_size = 0
+    with os.scandir(SASS_CACHE_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(".css"):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= SASS_CACHE_MAX_SIZE:
+            break
+        os.remove(path)
+        total_size -= size
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _decode_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _pb_bytes(field: int, value: bytes | str) -> bytes:
+    if isinstance(value, str):
+        value = value.encode()
+    return _encode_varint(field << 3 | 2) + _encode_varint(len(value)) + value
+
 
+def _pb_varint(field: int, value: int) -> bytes:
+    return _encode_varint(field << 3) + _encode_varint(value)
+
+
+def _pb_parse(data: bytes) -> dict[int, list]:
+    # A minimal protobuf decoder: field number -> list of raw values
+    fields: dict[int, list] = {}
+    pos = 0
+    while pos < len(data):
+        tag, pos = _decode_varint(data, pos)
+        field, wire_type = tag >> 3, tag & 7
+
+        value: int | bytes
+        if wire_type == 0:
+            value, pos = _decode_varint(data, pos)
+        elif wire_type == 2:
+            length, pos = _decode_varint(data, pos)
+            value = data[pos : pos + length]
+            pos += length
+        elif wire_type == 1:
+            value = data[pos : pos + 8]
+            pos += 8
+        elif wire_type == 5:
+            value = data[pos : pos + 4]
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type: {wire_type}")
+
+        fields.setdefault(field, []).append(value)
+
+    return fields
+
+
+def _pb_str(fields: dict[int, list], field: int) -> str:
+    return fields.get(field, [b""])[0].decode()
+
+
+class _EmbeddedSassUnsupported(Exception):
+    pass
+
+
+class _EmbeddedSassCompiler:
+    """
+    A persistent ``sass --embedded`` process.
+    Compile requests are sent using the `Embedded Sass protocol <https://github.com/sass/sass/blob/main/spec/embedded-protocol.md>`_,
+    so the compiler starts only once instead of on every compilation.
+    """
+
+    def __init__(self, compiler_path: str) -> None:
+        self._compiler_path = compiler_path
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._available = True
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    def __start(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [self._compiler_path, "--embedded"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    def __stop(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def __build_request(
+        self, path: str | None, string: str | None, extra_args: list[str]
+    ) -> bytes:
+        request = b""
+        style = 0
+        charset = True
+        syntax = 0
+
+        args = iter(extra_args)
+        for arg in args:
+            if arg in ("-I", "--load-path"):
+                load_path = next(args, "")
+                request += _pb_bytes(6, _pb_bytes(1, os.path.abspath(load_path)))
+            elif arg.startswith("--load-path="):
+                load_path = arg.split("=", 1)[1]
+                request += _pb_bytes(6, _pb_bytes(1, os.path.abspath(load_path)))
+            elif arg.startswith("-I") and len(arg) > 2:
+                request += _pb_bytes(6, _pb_bytes(1, os.path.abspath(arg[2:])))
+            elif arg in ("-s", "--style") or arg.startswith("--style="):
+                value = arg.split("=", 1)[1] if "=" in arg else next(args, "")
+                if value not in ("expanded", "compressed"):
+                    raise _EmbeddedSassUnsupported()
+                style = 1 if value == "compressed" else 0
+            elif arg == "--no-charset":
+                charset = False
+            elif arg == "--charset":
+                charset = True
+            elif arg == "--indented":
+                syntax = 1
+            elif arg in ("-q", "--quiet"):
+                request += _pb_varint(14, 1)
+            elif arg == "--quiet-deps":
+                request += _pb_varint(11, 1)
+            elif arg == "--verbose":
+                request += _pb_varint(10, 1)
+            elif arg in ("--no-source-map", "--no-color", "--no-unicode"):
+                continue
+            else:
+                # the argument has no equivalent in the protocol
+                raise _EmbeddedSassUnsupported()
+
+        if string is not None:
+            # resolve relative imports from the current directory, like "sass --stdin" does
+            string_input = (
+                _pb_bytes(1, string)
+                + _pb_varint(3, syntax)
+                + _pb_bytes(4, _pb_bytes(1, os.getcwd()))
+            )
+            request = _pb_bytes(2, string_input) + request
+        else:
+            request = _pb_bytes(3, os.path.abspath(path)) + request  # type: ignore
+
+        request += _pb_varint(4, style)
+        request += _pb_varint(13, int(charset))
+
+        return request
+
+    def __read_packet(self, process: subprocess.Popen) -> tuple[int, bytes]:
+        assert process.stdout is not None
+
+        header = bytearray()
+        while True:
+            byte = process.stdout.read(1)
+            if not byte:
+                raise EOFError("The Sass compiler has exited")
+            header += byte
+            if not byte[0] & 0x80:
+                break
+
+        length, _ = _decode_varint(bytes(header), 0)
+        packet = process.stdout.read(length)
+        if len(packet) != length:
+            raise EOFError("The Sass compiler has exited")
+
+        compilation_id, pos = _decode_varint(packet, 0)
+        return compilation_id, packet[pos:]
+
+    def compile(
+        self, path: str | None, string: str | None, extra_args: list[str]
+    ) -> str:
+        request = self.__build_request(path, string, extra_args)
+
+        with self._lock:
+            try:
+                process = self.__start()
+                assert process.stdin is not None
+
+                self._last_id = self._last_id % 0xFFFFFFFF + 1
+                payload = _encode_varint(self._last_id) + _pb_bytes(2, request)
+                process.stdin.write(_encode_varint(len(payload)) + payload)
+                process.stdin.flush()
+
+                while True:
+                    compilation_id, message = self.__read_packet(process)
+                    fields = _pb_parse(message)
+
+                    if 1 in fields:
+                        error = _pb_parse(fields[1][0])
+                        raise EOFError(f"Sass protocol error: {_pb_str(error, 3)}")
+
+                    if compilation_id != self._last_id:
+                        continue
+
+                    if 3 in fields:
+                        log_event = _pb_parse(fields[3][0])
+                        logger.debug(_pb_str(log_event, 6) or _pb_str(log_event, 3))
+                    elif 2 in fields:
+                        return self.__parse_response(_pb_parse(fields[2][0]))
+            except (OSError, EOFError, ValueError, IndexError):
+                # the compiler doesn't support the embedded protocol or has crashed
+                self.__stop()
+                self._available = False
+                raise _EmbeddedSassUnsupported() from None
+
+    def __parse_response(self, response: dict[int, list]) -> str:
+        if 2 in response:
+            return _pb_str(_pb_parse(response[2][0]), 1)
+
+        failure = _pb_parse(response[3][0])
+        raise SassCompilationError(_pb_str(failure, 4) or _pb_str(failure, 1))
+
+
+_embedded_compilers: dict[str, _EmbeddedSassCompiler] = {}
+
+
+def _compile_embedded(
+    path: str | None, string: str | None, compiler_path: str, extra_args: list[str]
+) -> str | None:
+    compiler = _embedded_compilers.get(compiler_path, None)
+    if compiler is None:
+        compiler = _EmbeddedSassCompiler(compiler_path)
+        _embedded_compilers[compiler_path] = compiler
+
+    if not compiler.available:
+        return None
+
+    try:
+        return compiler.compile(path, string, extra_args)
+    except _EmbeddedSassUnsupported:
+        return None
+
+
+def compile_file(path: str, compiler_path: str, extra_args: list[str]) -> str:
+    # Without the output argument, the compiled CSS is written to stdout
     result = subprocess.run(
-        [compiler_path, path, compiled_css, *extra_args] + extra_args,
+        [compiler_path, path, *extra_args],
         capture_output=True,
     )
 
     if result.returncode != 0:
         raise SassCompilationError(result.stderr.decode())
 
-    with open(compiled_css) as file:
-        return file.read()
+    return result.stdout.decode()
 
 
 def compile_string(string: str, compiler_path: str, extra_args: list[str]) -> str:
@@ -49,6 +497,7 @@ def sass_compile(
     string: str | None = None,
     compiler: Literal["sass", "grass"] | None = None,
     extra_args: list[str] | None = None,
+    cache: bool = True,
 ) -> str:
     """
     Compile a SASS/SCSS file or string.
@@ -60,6 +509,14 @@ def sass_compile(
         string: A string with SASS/SCSS style.
         compiler: The desired Sass compiler, either ``sass`` or ``grass``.
         *extra_args: Additional arguments to pass to the Sass compiler.
+        cache: Whether to use the compilation cache.
+
+    With Dart Sass, a single ``sass --embedded`` process is kept running and reused for all compilations.
+    Grass, and Dart Sass versions without the embedded protocol, are started once per compilation.
+
+    The compiled CSS is cached in :obj:`SASS_CACHE_DIR`, keyed by the contents of the file (or string),
+    all files it imports (see :func:`get_sass_dependencies`), the compiler and ``extra_args``.
+    If none of them have changed since the last compilation, the compiler is not invoked at all.
 
     Raises:
         TypeError: If neither of the arguments is provided.
@@ -72,19 +529,44 @@ def sass_compile(
     if compiler and compiler not in sass_compilers:
         raise SassNotFoundError()
 
-    if compiler:
-        compiler_path = sass_compilers[compiler]
-    else:
-        compiler_path = next(iter(sass_compilers.values()))
+    # the first available compiler by default
+    compiler_name: str = compiler or next(iter(sass_compilers))
+    compiler_path = sass_compilers[compiler_name]
 
     if not extra_args:
         extra_args = []
 
-    if string:
-        return compile_string(string, compiler_path, extra_args)
+    if not string and not path:
+        raise TypeError("sass_compile() requires at least one positional argument")
 
-    elif path:
-        return compile_file(path, compiler_path, extra_args)
+    key = None
+    if cache:
+        try:
+            key = _get_cache_key(compiler_path, extra_args, path, string)
+        except (OSError, UnicodeDecodeError):
+            # e.g., the file doesn't exist, let the compiler report it
+            pass
 
-    else:
-        raise TypeError("sass_compile() requires at least one positional argument")
+        if key is not None:
+            css = _read_cache(key)
+            if css is not None:
+                return css
+
+    css = None
+    if compiler_name == "sass":
+        # Dart Sass can stay running and compile over the embedded protocol
+        css = _compile_embedded(path, string, compiler_path, extra_args)
+
+    if css is None:
+        if string:
+            css = compile_string(string, compiler_path, extra_args)
+        else:
+            css = compile_file(path, compiler_path, extra_args)  # type: ignore
+
+    if key is not None:
+        try:
+            _write_cache(key, css)
+        except OSError as e:
+            logger.warning(f"Failed to write the Sass cache: {e}")
+
+    return css
@@ -1,6 +1,8 @@
 import socket
 from collections.abc import Generator
-from typing import Literal
+from typing import Literal, overload
+
+_RECV_SIZE = 65536
 
 
 def send_socket(
@@ -21,7 +23,7 @@ def send_socket(
     Returns:
         The response from the socket.
     """
-    sock.send(message.encode())
+    sock.sendall(message.encode())
 
     resp = bytearray()
     end_bytes = end_char.encode() if end_char is not None else None
@@ -39,9 +41,27 @@ def send_socket(
     return resp.decode("utf-8", errors=errors)
 
 
+@overload
+def listen_socket(
+    sock: socket.socket,
+    errors: Literal["strict", "replace", "ignore"] = ...,
+    decode: Literal[True] = ...,
+) -> Generator[str, None, None]: ...
+
+
+@overload
 def listen_socket(
-    sock: socket.socket, errors: Literal["strict", "replace", "ignore"] = "strict"
-) -> Generator[str, None, None]:
+    sock: socket.socket,
+    errors: Literal["strict", "replace", "ignore"] = ...,
+    decode: Literal[False] = ...,
+) -> Generator[bytes, None, None]: ...
+
+
+def listen_socket(
+    sock: socket.socket,
+    errors: Literal["strict", "replace", "ignore"] = "strict",
+    decode: bool = True,
+) -> Generator[str, None, None] | Generator[bytes, None, None]:
     """
     Listen to the socket.
     This function is a generator.
@@ -49,6 +69,8 @@ def listen_socket(
     Args:
         sock: An instance of a socket.
         errors: The error handling scheme that will be passed to :py:meth:`bytes.decode`.
+        decode: Whether to decode the messages. If ``True``, this function will yield :obj:`str`, otherwise :obj:`bytes`
+            (e.g., to pass them directly to :func:`~ignis.utils.json_loads`).
 
     Returns:
         A generator that yields responses from the socket.
@@ -64,12 +86,39 @@ def listen_socket(
                 print(message)
     """
 
-    buffer = b""
+    # Data is received directly into a reusable buffer and lines are sliced out of it
+    # by offset, so a burst of many lines is never re-copied line by line.
+    buffer = bytearray(_RECV_SIZE)
+    view = memoryview(buffer)
+    start = 0  # beginning of the first incomplete line
+    end = 0  # end of the received data
+
     while True:
-        new_data = sock.recv(8192)
-        if not new_data:
+        if end == len(buffer):
+            if start > 0:
+                # move the incomplete line to the beginning of the buffer
+                view[: end - start] = view[start:end]
+                end -= start
+                start = 0
+            else:
+                # the line doesn't fit into the buffer, grow it
+                view.release()
+                buffer.extend(bytes(len(buffer)))
+                view = memoryview(buffer)
+
+        received = sock.recv_into(view[end:])
+        if not received:
             break
-        buffer += new_data
-        while b"\n" in buffer:
-            data, buffer = buffer.split(b"\n", 1)
-            yield data.decode("utf-8", errors=errors)
+
+        scan = end
+        end += received
+
+        while (newline := buffer.find(b"\n", scan, end)) != -1:
+            if decode:
+                yield str(view[start:newline], "utf-8", errors)
+            else:
+                yield bytes(view[start:newline])
+            start = scan = newline + 1
+
+        if start == end:
+            start = end = 0
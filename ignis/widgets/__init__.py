@@ -24,6 +24,8 @@ from .eventbox import EventBox
 from .headerbar import HeaderBar
 from .listboxrow import ListBoxRow
 from .listbox import ListBox
+from .listview import ListView
+from .gridview import GridView
 from .check_button import CheckButton
 from .spin_button import SpinButton
 from .dropdown import DropDown
@@ -68,6 +70,8 @@ class Widget:
     HeaderBar: TypeAlias = HeaderBar
     ListBoxRow: TypeAlias = ListBoxRow
     ListBox: TypeAlias = ListBox
+    ListView: TypeAlias = ListView
+    GridView: TypeAlias = GridView
     Picture: TypeAlias = Picture
     CheckButton: TypeAlias = CheckButton
     SpinButton: TypeAlias = SpinButton
@@ -100,11 +104,13 @@ __all__ = [
     "Fixed",
     "FixedChild",
     "Grid",
+    "GridView",
     "HeaderBar",
     "Icon",
     "Label",
     "ListBox",
     "ListBoxRow",
+    "ListView",
     "Overlay",
     "Picture",
     "PopoverMenu",
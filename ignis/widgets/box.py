@@ -1,6 +1,23 @@
 from gi.repository import Gtk  # type: ignore
 from ignis.base_widget import BaseWidget
 from ignis.gobject import IgnisProperty
+from collections.abc import Callable, Hashable
+
+
+def _reuse_by_key(
+    old: list[Gtk.Widget],
+    new: list[Gtk.Widget],
+    key: Callable[[Gtk.Widget], Hashable] | None,
+) -> list[Gtk.Widget]:
+    # replace new widgets with current ones that have the same key
+    if key is None:
+        return new
+
+    current: dict[Hashable, Gtk.Widget] = {}
+    for widget in old:
+        current.setdefault(key(widget), widget)
+
+    return [current.pop(key(widget), widget) for widget in new]
 
 
 class Box(Gtk.Box, BaseWidget):
@@ -37,34 +54,70 @@ class Box(Gtk.Box, BaseWidget):
     def __init__(self, **kwargs):
         Gtk.Box.__init__(self)
         self._child: list[Gtk.Widget] = []
+        self._child_key: Callable[[Gtk.Widget], Hashable] | None = None
         BaseWidget.__init__(self, **kwargs)
 
     @IgnisProperty
     def child(self) -> list[Gtk.Widget]:
         """
         A list of child widgets.
+
+        Setting a new list only removes, inserts and reorders the widgets that differ from the current ones,
+        widgets present in both lists are kept as they are.
         """
         return self._child
 
     @child.setter
     def child(self, child: list[Gtk.Widget]) -> None:
+        new = _reuse_by_key(self._child, [c for c in child if c], self._child_key)
+        new_set = set(new)
+
         for c in self._child:
-            super().remove(c)
+            if c not in new_set:
+                super().remove(c)
+
+        previous = None
+        for c in new:
+            if c.get_parent() is self:
+                if c.get_prev_sibling() is not previous:
+                    self.reorder_child_after(c, previous)
+            else:
+                self.__track_unparent(c)
+                self.insert_child_after(c, previous)
+            previous = c
+
+        self._child = new
+        self.notify("child")
 
-        self._child = []
-        for c in child:
-            if c:
-                self.append(c)
+    @IgnisProperty
+    def child_key(self) -> Callable[[Gtk.Widget], Hashable] | None:
+        """
+        A function returning a key that identifies a child widget, e.g., the ID of the item it displays.
 
-    def append(self, child: Gtk.Widget) -> None:
+        When :attr:`child` is set, a new widget with the same key as a current one is discarded
+        and the current widget is kept in its place.
+        Useful when the children are recreated from a service property but bind to their items,
+        so they don't need to be replaced.
+        """
+        return self._child_key
+
+    @child_key.setter
+    def child_key(self, value: Callable[[Gtk.Widget], Hashable] | None) -> None:
+        self._child_key = value
+
+    def __track_unparent(self, child: Gtk.Widget) -> None:
         _orig_unparent = child.unparent
 
         def unparent_wrapper(*args, **kwargs):
-            self.remove(child)
+            if child in self._child:
+                self.remove(child)
             _orig_unparent(*args, **kwargs)
             child.unparent = _orig_unparent
 
         child.unparent = unparent_wrapper
+
+    def append(self, child: Gtk.Widget) -> None:
+        self.__track_unparent(child)
         self._child.append(child)
         super().append(child)
         self.notify("child")
@@ -75,6 +128,7 @@ class Box(Gtk.Box, BaseWidget):
         self.notify("child")
 
     def prepend(self, child: Gtk.Widget) -> None:
+        self.__track_unparent(child)
         self._child.insert(0, child)
         super().prepend(child)
         self.notify("child")
@@ -1,6 +1,8 @@
 from gi.repository import Gtk  # type: ignore
 from ignis.base_widget import BaseWidget
 from ignis.gobject import IgnisProperty
+from ignis.widgets.box import _reuse_by_key
+from collections.abc import Callable, Hashable
 
 
 class Grid(Gtk.Grid, BaseWidget):
@@ -37,6 +39,7 @@ class Grid(Gtk.Grid, BaseWidget):
         self._column_num: int | None = column_num
         self._row_num: int | None = row_num
         self._child: list[Gtk.Widget] = []
+        self._child_key: Callable[[Gtk.Widget], Hashable] | None = None
         BaseWidget.__init__(self, **kwargs)
 
     @IgnisProperty
@@ -67,23 +70,58 @@ class Grid(Gtk.Grid, BaseWidget):
     def child(self) -> list[Gtk.Widget]:
         """
         A list of child widgets.
+
+        Setting a new list only removes and attaches the widgets that differ from the current ones,
+        widgets present in both lists are only moved to their new cells.
         """
         return self._child
 
     @child.setter
     def child(self, child: list[Gtk.Widget]) -> None:
+        new = _reuse_by_key(self._child, list(child), self._child_key)
+        new_set = set(new)
+
         for c in self._child:
-            self.remove(c)
-        self._child = child
+            if c not in new_set:
+                self.remove(c)
+        self._child = new
         self.__apply()
 
-    def __apply(self) -> None:
+    @IgnisProperty
+    def child_key(self) -> Callable[[Gtk.Widget], Hashable] | None:
+        """
+        A function returning a key that identifies a child widget, e.g., the ID of the item it displays.
+
+        When :attr:`child` is set, a new widget with the same key as a current one is discarded
+        and the current widget is kept in its place.
+        """
+        return self._child_key
+
+    @child_key.setter
+    def child_key(self, value: Callable[[Gtk.Widget], Hashable] | None) -> None:
+        self._child_key = value
+
+    def __get_cell(self, index: int) -> tuple[int, int]:
         if self.column_num:
-            for i, c in enumerate(self.child):
-                self.attach(c, i % self.column_num, i // self.column_num, 1, 1)
+            return index % self.column_num, index // self.column_num
         elif self.row_num:
-            for i, c in enumerate(self.child):
-                self.attach(c, i // self.row_num, i % self.row_num, 1, 1)
+            return index // self.row_num, index % self.row_num
         else:
-            for c in self.child:
-                self.attach(c, 1, 1, 1, 1)
+            return 1, 1
+
+    def __apply(self) -> None:
+        layout_manager = self.get_layout_manager()
+
+        for i, c in enumerate(self.child):
+            column, row = self.__get_cell(i)
+
+            if c.get_parent() is not self:
+                self.attach(c, column, row, 1, 1)
+                continue
+
+            # move without detaching the widget
+            layout_child = layout_manager.get_layout_child(c)
+            if layout_child.get_column() != column:
+                layout_child.set_column(column)
+            if layout_child.get_row() != row:
+                layout_child.set_row(row)
@@ -0,0 +1,45 @@
+from gi.repository import Gtk, Gio  # type: ignore
+from ignis.base_widget import BaseWidget
+from ignis.widgets.listview import _ItemFactory, _ItemViewMixin
+
+
+class GridView(Gtk.GridView, _ItemViewMixin):
+    """
+    Bases: :class:`Gtk.GridView`
+
+    A grid that creates widgets only for visible items
+    and reuses them while scrolling, so it stays fast with thousands of items.
+    Must be placed inside :class:`~ignis.widgets.Scroll`.
+
+    The same as :class:`~ignis.widgets.ListView`, but items are arranged in columns.
+
+    Args:
+        **kwargs: Properties to set.
+
+    .. code-block:: python
+
+        from ignis.services.applications import ApplicationsService
+
+        applications = ApplicationsService.get_default()
+
+        widgets.Scroll(
+            vexpand=True,
+            child=widgets.GridView(
+                max_columns=6,
+                items=applications.apps_collection,
+                create_widget=lambda app: widgets.Icon(image=app.icon, pixel_size=48),
+                update_widget=lambda icon, app: icon.set_image(app.icon),
+            ),
+        )
+    """
+
+    __gtype_name__ = "IgnisGridView"
+    __gproperties__ = {**BaseWidget.gproperties}
+
+    def __init__(self, **kwargs):
+        Gtk.GridView.__init__(self)
+        self._items: Gio.ListModel | None = None
+        self._item_factory = _ItemFactory()
+        self.factory = self._item_factory.factory
+        self.override_enum("orientation", Gtk.Orientation)
+        BaseWidget.__init__(self, **kwargs)
@@ -2,6 +2,8 @@ from gi.repository import Gtk  # type: ignore
 from ignis.base_widget import BaseWidget
 from ignis.widgets.listboxrow import ListBoxRow
 from ignis.gobject import IgnisProperty
+from ignis.widgets.box import _reuse_by_key
+from collections.abc import Callable, Hashable
 
 
 class ListBox(Gtk.ListBox, BaseWidget):
@@ -35,6 +37,7 @@ class ListBox(Gtk.ListBox, BaseWidget):
     def __init__(self, **kwargs):
         Gtk.ListBox.__init__(self)
         self._rows: list[Gtk.Widget] = []
+        self._row_key: Callable[[Gtk.Widget], Hashable] | None = None
         BaseWidget.__init__(self, **kwargs)
 
         self.connect("row_activated", self.__on_row_activated)
@@ -58,22 +61,59 @@ class ListBox(Gtk.ListBox, BaseWidget):
     def rows(self) -> list[Gtk.Widget]:
         """
         A list of rows.
+
+        Setting a new list only removes, inserts and reorders the rows that differ from the current ones,
+        rows present in both lists are kept as they are.
         """
         return self._rows
 
     @rows.setter
     def rows(self, value: list[Gtk.Widget]) -> None:
-        for i in self._rows:
-            self.remove(i)
+        new = _reuse_by_key(self._rows, list(value), self._row_key)
+        new_set = set(new)
 
-        for i in value:
-            self.append(i)
+        for i in self._rows:
+            if i not in new_set:
+                super().remove(i)
+
+        for index, i in enumerate(new):
+            row = self.__get_row(i)
+            if row is not None:
+                if row is self.get_row_at_index(index):
+                    continue
+                # move the row (or the row GTK wrapped the widget into)
+                super().remove(row)
+                super().insert(row, index)
+            else:
+                super().insert(i, index)
 
             if isinstance(i, ListBoxRow):
                 if i.selected:
                     self.select_row(i)
 
-        self._rows = value
+        self._rows = new
+        self.notify("rows")
+
+    @IgnisProperty
+    def row_key(self) -> Callable[[Gtk.Widget], Hashable] | None:
+        """
+        A function returning a key that identifies a row, e.g., the ID of the item it displays.
+
+        When :attr:`rows` is set, a new row with the same key as a current one is discarded
+        and the current row is kept in its place.
+        """
+        return self._row_key
+
+    @row_key.setter
+    def row_key(self, value: Callable[[Gtk.Widget], Hashable] | None) -> None:
+        self._row_key = value
+
+    def __get_row(self, child: Gtk.Widget) -> Gtk.ListBoxRow | None:
+        # the row containing the child in this list box, if any
+        row = child if isinstance(child, Gtk.ListBoxRow) else child.get_parent()
+        if isinstance(row, Gtk.ListBoxRow) and row.get_parent() is self:
+            return row
+        return None
 
     def append(self, child: Gtk.Widget) -> None:
         self._rows.append(child)
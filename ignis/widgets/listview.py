@@ -0,0 +1,136 @@
+from gi.repository import Gtk, Gio, GObject  # type: ignore
+from ignis.base_widget import BaseWidget
+from collections.abc import Callable
+from ignis.gobject import IgnisProperty
+
+
+def _to_list_model(value: Gio.ListModel | list[GObject.Object]) -> Gio.ListModel:
+    if isinstance(value, Gio.ListModel):
+        return value
+
+    store = Gio.ListStore.new(GObject.Object)
+    store.splice(0, 0, value)
+    return store
+
+
+class _ItemFactory:
+    """
+    Creates and recycles widgets for the items of a list model,
+    shared between :class:`ListView` and :class:`GridView`.
+    """
+
+    def __init__(self) -> None:
+        self.create_widget: Callable[[GObject.Object], Gtk.Widget] | None = None
+        self.update_widget: Callable[[Gtk.Widget, GObject.Object], None] | None = None
+
+        self.factory = Gtk.SignalListItemFactory()
+        self.factory.connect("bind", self.__on_bind)
+        self.factory.connect("unbind", self.__on_unbind)
+
+    def __on_bind(self, factory, list_item: Gtk.ListItem) -> None:
+        item = list_item.get_item()
+        child = list_item.get_child()
+
+        if child is not None and self.update_widget:
+            self.update_widget(child, item)
+        elif self.create_widget:
+            list_item.set_child(self.create_widget(item))
+
+    def __on_unbind(self, factory, list_item: Gtk.ListItem) -> None:
+        # widgets that can't be updated are created anew for every item
+        if not self.update_widget:
+            list_item.set_child(None)
+
+
+class _ItemViewMixin(BaseWidget):
+    """
+    Properties shared between :class:`ListView` and :class:`GridView`.
+    """
+
+    _items: Gio.ListModel | None
+    _item_factory: _ItemFactory
+
+    @IgnisProperty
+    def items(self) -> GObject.Object | None:
+        """
+        The ``Gio.ListModel`` with items to display.
+
+        A list of GObjects is also accepted, but it is copied to a new model on every change,
+        so a ``Gio.ListModel`` is preferable.
+        """
+        return self._items
+
+    @items.setter
+    def items(self, value: Gio.ListModel | list[GObject.Object]) -> None:
+        self._items = _to_list_model(value)
+        self.model = Gtk.NoSelection.new(self._items)
+
+    @IgnisProperty
+    def create_widget(self) -> Callable[[GObject.Object], Gtk.Widget] | None:
+        """
+        The function to create a widget for an item.
+        It receives the item and must return a widget.
+        """
+        return self._item_factory.create_widget
+
+    @create_widget.setter
+    def create_widget(self, value: Callable[[GObject.Object], Gtk.Widget]) -> None:
+        self._item_factory.create_widget = value
+
+    @IgnisProperty
+    def update_widget(self) -> Callable[[Gtk.Widget, GObject.Object], None] | None:
+        """
+        The function to reuse a widget previously created by :attr:`create_widget` for another item.
+        It receives the widget and the new item.
+
+        If not set, a new widget is created every time an item is shown.
+        """
+        return self._item_factory.update_widget
+
+    @update_widget.setter
+    def update_widget(
+        self, value: Callable[[Gtk.Widget, GObject.Object], None]
+    ) -> None:
+        self._item_factory.update_widget = value
+
+
+class ListView(Gtk.ListView, _ItemViewMixin):
+    """
+    Bases: :class:`Gtk.ListView`
+
+    A vertical (or horizontal) list that creates widgets only for visible items
+    and reuses them while scrolling, so it stays fast with thousands of items.
+    Must be placed inside :class:`~ignis.widgets.Scroll`.
+
+    Use a collection of a service (e.g., :attr:`~ignis.services.notifications.NotificationService.notifications_collection`)
+    or any other ``Gio.ListModel`` as :attr:`items`, so only changed rows are updated.
+
+    Args:
+        **kwargs: Properties to set.
+
+    .. code-block:: python
+
+        from ignis.services.notifications import NotificationService
+
+        notifications = NotificationService.get_default()
+
+        widgets.Scroll(
+            vexpand=True,
+            child=widgets.ListView(
+                items=notifications.notifications_collection,
+                create_widget=lambda notification: widgets.Label(label=notification.summary),
+                update_widget=lambda label, notification: label.set_label(notification.summary),
+            ),
+        )
+    """
+
+    __gtype_name__ = "IgnisListView"
+    __gproperties__ = {**BaseWidget.gproperties}
+
+    def __init__(self, **kwargs):
+        Gtk.ListView.__init__(self)
+        self._items: Gio.ListModel | None = None
+        self._item_factory = _ItemFactory()
+        self.factory = self._item_factory.factory
+        self.override_enum("orientation", Gtk.Orientation)
+        BaseWidget.__init__(self, **kwargs)
@@ -0,0 +1,21 @@
+import pytest
+
+gi = pytest.importorskip("gi")
+
+try:
+    from ignis._journal import Journal
+except (ImportError, ValueError) as e:
+    pytest.skip(f"Ignis can't be imported here: {e}", allow_module_level=True)
+
+
+def test_writer_survives_unserializable_record(tmp_path) -> None:
+    journal = Journal(str(tmp_path / "journal.jsonl"))
+    journal.add({"id": 1, "value": object()})
+    journal.flush()
+
+    journal.add({"id": 2, "value": "ok"})
+    journal.flush()
+
+    reloaded = Journal(journal.path)
+    reloaded.load()
+    assert [r["id"] for r in reloaded.records] == [2]
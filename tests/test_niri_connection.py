@@ -0,0 +1,115 @@
+import os
+import json
+import socket
+import asyncio
+import tempfile
+import threading
+import importlib.util
+import pytest
+
+# connection.py has no dependencies on the rest of Ignis, load it without importing ignis (and gi)
+_spec = importlib.util.spec_from_file_location(
+    "niri_connection",
+    os.path.join(
+        os.path.dirname(__file__), "..", "ignis", "services", "niri", "connection.py"
+    ),
+)
+assert _spec and _spec.loader
+connection = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(connection)
+
+
+class FakeNiri:
+    """
+    Answers every request with ``{"Ok": <request>}``,
+    closing each connection after ``per_connection`` replies.
+    """
+
+    def __init__(self, per_connection: int) -> None:
+        self.per_connection = per_connection
+        self.connections = 0
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "niri.sock")
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen()
+        threading.Thread(target=self.__serve, daemon=True).start()
+
+    def __serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            with conn, conn.makefile("rb") as file:
+                for _ in range(self.per_connection):
+                    line = file.readline()
+                    if not line:
+                        break
+                    conn.sendall(json.dumps({"Ok": json.loads(line)}).encode() + b"\n")
+
+    def close(self) -> None:
+        self._server.close()
+        self._dir.cleanup()
+
+
+@pytest.fixture
+def make_server():
+    servers = []
+
+    def factory(per_connection: int) -> FakeNiri:
+        server = FakeNiri(per_connection)
+        servers.append(server)
+        return server
+
+    yield factory
+    for server in servers:
+        server.close()
+
+
+def _expected(cmds):
+    return [json.dumps({"Ok": cmd}) for cmd in cmds]
+
+
+def test_batch_is_resent_when_a_fresh_connection_closes_partway(make_server):
+    server = make_server(per_connection=2)
+    conn = connection.NiriConnection(server.path)
+    cmds = ["A", "B", "C", "D", "E"]
+
+    assert conn.request(*cmds) == _expected(cmds)
+    assert server.connections == 3
+    conn.close()
+
+
+def test_async_batch_is_resent_when_a_fresh_connection_closes_partway(make_server):
+    server = make_server(per_connection=2)
+    conn = connection.NiriConnection(server.path)
+    cmds = ["A", "B", "C", "D", "E"]
+
+    async def run():
+        replies = await conn.request_async(*cmds)
+        conn.close()
+        return replies
+
+    assert asyncio.run(run()) == _expected(cmds)
+    assert server.connections == 3
+
+
+def test_stale_connection_is_reopened(make_server):
+    server = make_server(per_connection=1)
+    conn = connection.NiriConnection(server.path)
+
+    assert conn.request("A") == _expected(["A"])
+    # the server has closed the first connection by now
+    assert conn.request("B") == _expected(["B"])
+    conn.close()
+
+
+def test_fresh_connection_without_replies_raises(make_server):
+    server = make_server(per_connection=0)
+    conn = connection.NiriConnection(server.path)
+
+    with pytest.raises(OSError):
+        conn.request("A")
+    assert server.connections == 1
@@ -0,0 +1,33 @@
+import pytest
+
+gi = pytest.importorskip("gi")
+
+try:
+    from ignis import utils
+    from ignis.options_manager import OptionsManager, OptionsGroup
+except (ImportError, ValueError) as e:
+    pytest.skip(f"Ignis can't be imported here: {e}", allow_module_level=True)
+
+
+class _Options(OptionsManager):
+    class General(OptionsGroup):
+        value: int = 0
+
+    general = General()
+
+
+def test_flush_writes_without_threads(tmp_path, monkeypatch) -> None:
+    file = tmp_path / "options.json"
+    options = _Options(file=str(file), hot_reload=False)
+    options.general.value = 42
+    # as if the autosave is still waiting for the debounce
+    options._autosave_pending = True
+
+    # like at interpreter shutdown
+    def thread(*args, **kwargs):
+        raise RuntimeError("can't create new thread at interpreter shutdown")
+
+    monkeypatch.setattr(utils, "thread", thread)
+    options.flush()
+
+    assert '"value": 42' in file.read_text()
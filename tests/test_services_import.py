@@ -0,0 +1,30 @@
+import importlib
+import pkgutil
+import pytest
+
+gi = pytest.importorskip("gi")
+
+try:
+    import ignis.services
+    from ignis import exceptions
+except (ImportError, ValueError) as e:
+    pytest.skip(f"Ignis can't be imported here: {e}", allow_module_level=True)
+
+# Services that depend on optional libraries raise these if they are missing
+OPTIONAL_DEPENDENCY_ERRORS = (
+    exceptions.GvcNotFoundError,
+    exceptions.NetworkManagerNotFoundError,
+    exceptions.GstNotFoundError,
+    exceptions.GnomeBluetoothNotFoundError,
+)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [module.name for module in pkgutil.iter_modules(ignis.services.__path__)],
+)
+def test_service_imports(name: str) -> None:
+    try:
+        importlib.import_module(f"ignis.services.{name}")
+    except OPTIONAL_DEPENDENCY_ERRORS as e:
+        pytest.skip(str(e))